@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
+from services import crop_service
 
 router = APIRouter()
 
@@ -10,8 +11,8 @@ class CropInput(BaseModel):
 
 @router.post("/crops")
 def recommend_crops(data: CropInput):
-    # mock crops for now
+    rec = crop_service.recommend(data.model_dump())
     return {
         "input": data.model_dump(),
-        "recommendations": ["Wheat", "Rice", "Maize"]
+        "recommendations": rec["crops"]
     }
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
+from services import fertilizer_service
 
 router = APIRouter()
 
@@ -8,12 +9,8 @@ class FertilizerInput(BaseModel):
 
 @router.post("/fertilizer")
 def recommend_fertilizer(data: FertilizerInput):
-    # mock fertilizer recommendation
-    if data.ph < 6.5:
-        rec = "Add lime to increase soil pH"
-    else:
-        rec = "Use nitrogen-rich fertilizer"
+    rec = fertilizer_service.recommend({}, data.ph)
     return {
         "ph": data.ph,
-        "recommendation": rec
+        "recommendation": rec["fertilizer"]
     }
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
+from services import livestock_service
 
 router = APIRouter()
 
@@ -8,8 +9,8 @@ class LivestockInput(BaseModel):
 
 @router.post("/livestock")
 def recommend_livestock(data: LivestockInput):
-    # mock livestock for now
+    rec = livestock_service.recommend(data.model_dump())
     return {
         "input": data.model_dump(),
-        "recommendations": ["Goat", "Cow"]
+        "recommendations": rec["livestock"]
     }
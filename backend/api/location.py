@@ -1,12 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from ml_models.environment_model import get_environment_prediction
+from ml_models.environment_model import get_environment_prediction, get_environment_bulk, get_raster
 
 router = APIRouter()
 
+MAX_BULK_POINTS = 50_000
+
 class LocationRequest(BaseModel):
     latitude: float
     longitude: float
+    interpolate: bool = False
 
 class EnvironmentResponse(BaseModel):
     soil: str
@@ -16,11 +19,63 @@ class EnvironmentResponse(BaseModel):
     recommended_crops: list[str]
     recommended_livestock: list[str]
 
+class Point(BaseModel):
+    latitude: float
+    longitude: float
+
+class BulkLocationRequest(BaseModel):
+    points: list[Point] = []
+    polygon: list[Point] = []  # field outline; resolved to the raster cells inside it
+    interpolate: bool = False
+
+class PointEnvironment(EnvironmentResponse):
+    latitude: float
+    longitude: float
+
+class BulkEnvironmentResponse(BaseModel):
+    points: list[PointEnvironment]
+    cells: list[PointEnvironment]
+
 @router.post("/environment", response_model=EnvironmentResponse)
 async def analyze_environment(req: LocationRequest):
     """
     Endpoint: /analyze/environment
     Fetches real or simulated environment analysis from ML model
     """
-    data = get_environment_prediction(req.latitude, req.longitude)
+    data = get_environment_prediction(req.latitude, req.longitude, req.interpolate)
     return EnvironmentResponse(**data)
+
+def _polygon_points(polygon: list[Point]):
+    raster = get_raster()
+    vertices = [(p.latitude, p.longitude) for p in polygon]
+    try:
+        lats, lons = raster.polygon_cells(vertices, MAX_BULK_POINTS) if raster else ([], [])
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if len(lats) == 0:
+        # Field smaller than a cell (or no raster): use its centroid
+        lats = [sum(v[0] for v in vertices) / len(vertices)]
+        lons = [sum(v[1] for v in vertices) / len(vertices)]
+    return [float(v) for v in lats], [float(v) for v in lons]
+
+@router.post("/environment/bulk", response_model=BulkEnvironmentResponse)
+async def analyze_environment_bulk(req: BulkLocationRequest):
+    """
+    Endpoint: /analyze/environment/bulk
+    Resolves many points, and/or every raster cell inside a polygon, in one call.
+    """
+    if req.polygon and len(req.polygon) < 3:
+        raise HTTPException(status_code=422, detail="polygon needs at least 3 points")
+
+    lats = [p.latitude for p in req.points]
+    lons = [p.longitude for p in req.points]
+    cell_lats, cell_lons = _polygon_points(req.polygon) if req.polygon else ([], [])
+    if len(lats) + len(cell_lats) > MAX_BULK_POINTS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_POINTS} points per request")
+
+    envs = get_environment_bulk(lats + cell_lats, lons + cell_lons, req.interpolate)
+    located = [
+        {**env, "latitude": lat, "longitude": lon}
+        for env, lat, lon in zip(envs, lats + cell_lats, lons + cell_lons)
+    ]
+    return BulkEnvironmentResponse(points=located[:len(lats)], cells=located[len(lats):])
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+from api.location import EnvironmentResponse
+from services.plan_service import farm_plan
+
+router = APIRouter()
+
+class PlanRequest(BaseModel):
+    latitude: float
+    longitude: float
+    ph: Optional[float] = None  # defaults to the typical pH of the plot's soil
+    irrigation: str = "Drip"
+    area: float = 1.0  # hectares
+
+class CropPlan(BaseModel):
+    crop: str
+    water_need: str
+    water_amount: str
+    yield_value: float
+    total_yield: float
+    score: float
+
+class FertilizerAdvice(BaseModel):
+    ph: float
+    recommendation: str
+
+class PlanResponse(BaseModel):
+    environment: EnvironmentResponse
+    irrigation: str
+    area: float
+    crops: list[CropPlan]
+    livestock: list[str]
+    fertilizer: FertilizerAdvice
+
+@router.post("/plan", response_model=PlanResponse)
+async def plan_farm(req: PlanRequest):
+    """
+    Endpoint: /analyze/plan
+    Environment, ranked crops (water need, yield, score), livestock and
+    fertilizer for a plot in one call, instead of one call per service.
+    """
+    if req.area <= 0:
+        raise HTTPException(status_code=422, detail="area must be positive")
+    if req.ph is not None and not 0 <= req.ph <= 14:
+        raise HTTPException(status_code=422, detail="ph must be between 0 and 14")
+    return farm_plan(req.latitude, req.longitude, req.ph, req.irrigation, req.area)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
+from services import water_service
 
 router = APIRouter()
 
@@ -9,14 +10,9 @@ class WaterInput(BaseModel):
 
 @router.post("/water")
 def predict_water(data: WaterInput):
-    # mock prediction
-    water_need = "medium"
-    if data.crop.lower() == "rice":
-        water_need = "high"
-    elif data.crop.lower() == "millet":
-        water_need = "low"
+    pred = water_service.predict(data.model_dump())
     return {
         "crop": data.crop,
         "rainfall": data.rainfall,
-        "predicted_water_need": water_need
+        "predicted_water_need": pred["water_need"]
     }
@@ -1,9 +1,18 @@
-from fastapi import APIRouter
+import json
+from itertools import product
+from typing import Literal, Optional
+
+import numpy as np
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from ml_models.yield_model import predict_yield
+from ml_models.yield_model import predict_yield, predict_yield_batch
 
 router = APIRouter()
 
+MAX_BATCH_SCENARIOS = 100_000
+STREAM_CHUNK = 1000  # NDJSON lines per streamed chunk
+
 class SimulationRequest(BaseModel):
     crop: str
     livestock: str
@@ -17,6 +26,31 @@ class SimulationResponse(BaseModel):
     yield_value: float
     score: float
 
+class ScenarioGrid(BaseModel):
+    """Cross product of the option lists, all on the same plot conditions."""
+    crop: list[str]
+    livestock: list[str]
+    water_amount: list[str]
+    irrigation: list[str]
+    soil: str
+    temp: float
+    rainfall: float
+
+class BatchSimulationRequest(BaseModel):
+    scenarios: list[SimulationRequest] = []
+    grid: Optional[ScenarioGrid] = None
+    seed: Optional[int] = None
+    top_k: Optional[int] = None
+    rank_by: Literal["yield_value", "score"] = "yield_value"
+
+class ScenarioResult(SimulationRequest):
+    yield_value: float
+    score: float
+
+class BatchSimulationResponse(BaseModel):
+    count: int
+    results: list[ScenarioResult]
+
 @router.post("/simulate", response_model=SimulationResponse)
 async def simulate_farm(req: SimulationRequest):
     """
@@ -24,3 +58,64 @@ async def simulate_farm(req: SimulationRequest):
     """
     result = predict_yield(req.dict())
     return SimulationResponse(**result)
+
+def _scenario_rows(req: BatchSimulationRequest) -> list[dict]:
+    rows = [s.model_dump() for s in req.scenarios]
+    if req.grid:
+        g = req.grid
+        size = len(g.crop) * len(g.livestock) * len(g.water_amount) * len(g.irrigation)
+        if len(rows) + size > MAX_BATCH_SCENARIOS:
+            raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SCENARIOS} scenarios per batch")
+        fixed = {"soil": g.soil, "temp": g.temp, "rainfall": g.rainfall}
+        for crop, livestock, water, irrigation in product(g.crop, g.livestock, g.water_amount, g.irrigation):
+            rows.append({"crop": crop, "livestock": livestock, "water_amount": water,
+                         "irrigation": irrigation, **fixed})
+    if len(rows) > MAX_BATCH_SCENARIOS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SCENARIOS} scenarios per batch")
+    return rows
+
+def _run_batch(req: BatchSimulationRequest):
+    """Scores every scenario in one vectorised pass; returns (rows, order) ranked best first."""
+    rows = _scenario_rows(req)
+    scores = predict_yield_batch(
+        [r["irrigation"] for r in rows],
+        [r["water_amount"] for r in rows],
+        seed=req.seed,
+    )
+    for key in ("yield_value", "score"):
+        for row, value in zip(rows, scores[key].tolist()):
+            row[key] = value
+
+    ranking = scores[req.rank_by]
+    k = len(rows) if req.top_k is None else max(0, min(req.top_k, len(rows)))
+    if k < len(rows):
+        top = np.argpartition(-ranking, k - 1)[:k] if k else np.array([], dtype=int)
+        order = top[np.argsort(-ranking[top], kind="stable")]
+    else:
+        order = np.argsort(-ranking, kind="stable")
+    return rows, order.tolist()
+
+@router.post("/simulate/batch", response_model=BatchSimulationResponse)
+async def simulate_batch(req: BatchSimulationRequest):
+    """
+    Scores many scenarios (listed and/or a cross-product grid) in one call,
+    ranked by rank_by. Pass a seed for reproducible output and top_k to
+    return only the best results.
+    """
+    rows, order = _run_batch(req)
+    return BatchSimulationResponse(count=len(rows), results=[rows[i] for i in order])
+
+@router.post("/simulate/batch/stream")
+async def simulate_batch_stream(req: BatchSimulationRequest):
+    """
+    Same as /simulate/batch but streams the ranked results as NDJSON,
+    one scenario per line.
+    """
+    rows, order = _run_batch(req)
+
+    def lines():
+        for start in range(0, len(order), STREAM_CHUNK):
+            chunk = order[start:start + STREAM_CHUNK]
+            yield "".join(json.dumps(rows[i]) + "\n" for i in chunk)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,11 +1,16 @@
 from fastapi import FastAPI
-from api import location, yield_api
+from api import location, yield_api, crop, livestock, water, fertilizer, plan
 
 app = FastAPI(title="KrishiPatha Backend", version="1.0")
 
 # ✅ include routers
 app.include_router(location.router, prefix="/analyze", tags=["Location"])
 app.include_router(yield_api.router, prefix="/analyze", tags=["Yield Simulation"])
+app.include_router(crop.router, prefix="/analyze", tags=["Recommendations"])
+app.include_router(livestock.router, prefix="/analyze", tags=["Recommendations"])
+app.include_router(water.router, prefix="/analyze", tags=["Recommendations"])
+app.include_router(fertilizer.router, prefix="/analyze", tags=["Recommendations"])
+app.include_router(plan.router, prefix="/analyze", tags=["Farm Plan"])
 
 @app.get("/")
 def root():
@@ -1,33 +1,87 @@
 # backend/ml_models/environment_model.py
+import os
 import random
+from ml_models.environment_raster import EnvironmentRaster
 
-def get_environment_prediction(lat: float, lon: float) -> dict:
-    """
-    Placeholder for ML-based environment prediction.
-    Replace this with actual ML inference or pipeline call.
-    """
+_default_raster = os.path.join(os.path.dirname(__file__), "..", "data", "environment.kpr")
+RASTER_PATH = os.environ.get("KRISHIPATHA_ENV_RASTER", os.path.abspath(_default_raster))
+
+FALLBACK_CELL_DEG = 0.05  # grid used for the synthetic values when a point has no raster data
+
+CROPS_BY_SOIL = {
+    "clay": ["Rice", "Wheat", "Sugarcane"],
+    "sandy": ["Millet", "Maize", "Groundnut"],
+}
+DEFAULT_CROPS = ["Wheat", "Maize", "Pulses"]
+LIVESTOCK = ["Goat", "Cow", "Chicken"]
 
-    # Mock-up logic for now (randomized results)
-    soils = ["sandy", "loamy", "clay"]
-    soil = random.choice(soils)
-    avg_temp = round(random.uniform(20, 35), 1)
-    avg_rainfall = round(random.uniform(400, 900), 1)
-    water_source = random.choice(["river", "tube well", "rain-fed"])
+_raster = None
+_raster_checked = False
 
-    if soil == "clay":
-        crops = ["Rice", "Wheat", "Sugarcane"]
-    elif soil == "sandy":
-        crops = ["Millet", "Maize", "Groundnut"]
-    else:
-        crops = ["Wheat", "Maize", "Pulses"]
+def get_raster():
+    """The memory-mapped environment raster, or None if there is no raster file."""
+    global _raster, _raster_checked
+    if not _raster_checked:
+        _raster_checked = True
+        if os.path.exists(RASTER_PATH):
+            try:
+                _raster = EnvironmentRaster(RASTER_PATH)
+            except (OSError, ValueError) as e:
+                print("Environment raster unavailable:", e)
+    return _raster
 
-    livestock = ["Goat", "Cow", "Chicken"]
+def set_raster(raster):
+    """Swaps the raster used for lookups (e.g. a synthetic grid); None disables it."""
+    global _raster, _raster_checked
+    _raster, _raster_checked = raster, True
+
+def synthetic_environment(lat: float, lon: float) -> dict:
+    """
+    Mock-up values for points without raster data. Seeded by the grid cell,
+    so the same coordinates always give the same answer.
+    """
+    cell = (round(lat / FALLBACK_CELL_DEG), round(lon / FALLBACK_CELL_DEG))
+    rng = random.Random(f"{cell[0]}:{cell[1]}")
+    return {
+        "soil": rng.choice(["sandy", "loamy", "clay"]),
+        "avg_temp": round(rng.uniform(20, 35), 1),
+        "avg_rainfall": round(rng.uniform(400, 900), 1),
+        "water_source": rng.choice(["river", "tube well", "rain-fed"]),
+    }
 
+def with_recommendations(env: dict) -> dict:
     return {
-        "soil": soil,
-        "avg_temp": avg_temp,
-        "avg_rainfall": avg_rainfall,
-        "water_source": water_source,
-        "recommended_crops": crops,
-        "recommended_livestock": livestock,
+        **env,
+        "recommended_crops": CROPS_BY_SOIL.get(env["soil"], DEFAULT_CROPS),
+        "recommended_livestock": LIVESTOCK,
     }
+
+def get_environment_prediction(lat: float, lon: float, interpolate: bool = False) -> dict:
+    """
+    Environment for a point: an O(1) cell lookup in the environment raster,
+    with optional bilinear interpolation of rainfall and temperature.
+    """
+    raster = get_raster()
+    env = raster.lookup(lat, lon, interpolate) if raster else None
+    return with_recommendations(env or synthetic_environment(lat, lon))
+
+def get_environment_bulk(lats, lons, interpolate: bool = False) -> list[dict]:
+    """Vectorised get_environment_prediction for many points."""
+    raster = get_raster()
+    if raster is None:
+        return [with_recommendations(synthetic_environment(a, b)) for a, b in zip(lats, lons)]
+
+    found = raster.lookup_many(lats, lons, interpolate)
+    results = []
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        if found["valid"][i]:
+            env = {
+                "soil": found["soil"][i],
+                "avg_temp": float(found["avg_temp"][i]),
+                "avg_rainfall": float(found["avg_rainfall"][i]),
+                "water_source": found["water_source"][i],
+            }
+        else:
+            env = synthetic_environment(lat, lon)
+        results.append(with_recommendations(env))
+    return results
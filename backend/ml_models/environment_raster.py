@@ -0,0 +1,173 @@
+# backend/ml_models/environment_raster.py
+"""
+Gridded environment data (soil class, average rainfall, average temperature
+and water source) stored as one compact binary file and read through
+numpy.memmap, so a lookup touches a single cell instead of loading the grid.
+
+File layout:
+    8 bytes   magic b"KPENV01\\0"
+    4 bytes   little-endian header length
+    header    JSON: lat_min, lon_min, cell_size, nrows, ncols, soils, water_sources
+    padding   to a 16 byte boundary
+    cells     nrows x ncols records of CELL_DTYPE, row 0 is the southern edge
+"""
+import json
+import os
+import struct
+import numpy as np
+
+MAGIC = b"KPENV01\0"
+NODATA = 255  # soil/water code for cells without data
+CELL_DTYPE = np.dtype([("soil", "u1"), ("water", "u1"), ("rain", "<f4"), ("temp", "<f4")])
+
+SOIL_CLASSES = ["sandy", "loamy", "clay"]
+WATER_SOURCES = ["river", "tube well", "rain-fed"]
+
+
+def write_raster(path, lat_min, lon_min, cell_size, soil, water, rain, temp,
+                 soils=SOIL_CLASSES, water_sources=WATER_SOURCES):
+    """Writes equally shaped 2-D layers (soil/water as category codes) to `path`."""
+    soil = np.asarray(soil)
+    nrows, ncols = soil.shape
+    header = json.dumps({
+        "lat_min": float(lat_min), "lon_min": float(lon_min), "cell_size": float(cell_size),
+        "nrows": int(nrows), "ncols": int(ncols),
+        "soils": list(soils), "water_sources": list(water_sources),
+    }).encode()
+    offset = len(MAGIC) + 4 + len(header)
+    padding = b" " * (-offset % 16)
+
+    cells = np.empty((nrows, ncols), dtype=CELL_DTYPE)
+    cells["soil"] = soil
+    cells["water"] = water
+    cells["rain"] = rain
+    cells["temp"] = temp
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as fh:
+        fh.write(MAGIC)
+        fh.write(struct.pack("<I", len(header) + len(padding)))
+        fh.write(header + padding)
+        cells.tofile(fh)
+
+
+class EnvironmentRaster:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fh:
+            if fh.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not an environment raster")
+            (header_len,) = struct.unpack("<I", fh.read(4))
+            meta = json.loads(fh.read(header_len))
+        self.lat_min = meta["lat_min"]
+        self.lon_min = meta["lon_min"]
+        self.cell_size = meta["cell_size"]
+        self.nrows = meta["nrows"]
+        self.ncols = meta["ncols"]
+        self.soils = np.array(meta["soils"] + [None], dtype=object)
+        self.water_sources = np.array(meta["water_sources"] + [None], dtype=object)
+        self.cells = np.memmap(path, dtype=CELL_DTYPE, mode="r",
+                               offset=len(MAGIC) + 4 + header_len, shape=(self.nrows, self.ncols))
+
+    @property
+    def lat_max(self):
+        return self.lat_min + self.nrows * self.cell_size
+
+    @property
+    def lon_max(self):
+        return self.lon_min + self.ncols * self.cell_size
+
+    def cell_index(self, lats, lons):
+        """Row/column arrays for the given points, plus a mask of points inside the grid."""
+        rows = np.floor((np.asarray(lats, dtype=float) - self.lat_min) / self.cell_size).astype(np.int64)
+        cols = np.floor((np.asarray(lons, dtype=float) - self.lon_min) / self.cell_size).astype(np.int64)
+        inside = (rows >= 0) & (rows < self.nrows) & (cols >= 0) & (cols < self.ncols)
+        return np.clip(rows, 0, self.nrows - 1), np.clip(cols, 0, self.ncols - 1), inside
+
+    def _bilinear(self, layer, lats, lons):
+        # Cell values sit at cell centres; clamp to the edge cells outside them
+        fy = (np.asarray(lats, dtype=float) - self.lat_min) / self.cell_size - 0.5
+        fx = (np.asarray(lons, dtype=float) - self.lon_min) / self.cell_size - 0.5
+        fy = np.clip(fy, 0, self.nrows - 1)
+        fx = np.clip(fx, 0, self.ncols - 1)
+        r0 = np.floor(fy).astype(np.int64)
+        c0 = np.floor(fx).astype(np.int64)
+        r1 = np.minimum(r0 + 1, self.nrows - 1)
+        c1 = np.minimum(c0 + 1, self.ncols - 1)
+        wy = fy - r0
+        wx = fx - c0
+        top = self.cells[layer][r0, c0] * (1 - wx) + self.cells[layer][r0, c1] * wx
+        bottom = self.cells[layer][r1, c0] * (1 - wx) + self.cells[layer][r1, c1] * wx
+        return top * (1 - wy) + bottom * wy
+
+    def lookup_many(self, lats, lons, interpolate=False):
+        """
+        Vectorised lookup. Returns a dict of arrays (soil, water_source,
+        avg_rainfall, avg_temp) and a `valid` mask; points outside the grid
+        or on no-data cells are not valid.
+        """
+        rows, cols, inside = self.cell_index(lats, lons)
+        cells = self.cells[rows, cols]
+        # NODATA and any code past the header's classes land on the trailing None
+        known = (cells["soil"] < len(self.soils) - 1) & (cells["water"] < len(self.water_sources) - 1)
+        valid = inside & known & np.isfinite(cells["rain"]) & np.isfinite(cells["temp"])
+        if interpolate:
+            # Neighbours without data would poison the blend; keep the cell value there
+            rain = self._bilinear("rain", lats, lons)
+            temp = self._bilinear("temp", lats, lons)
+            rain = np.where(np.isfinite(rain), rain, cells["rain"])
+            temp = np.where(np.isfinite(temp), temp, cells["temp"])
+        else:
+            rain = cells["rain"].astype(float)
+            temp = cells["temp"].astype(float)
+        soil_codes = np.minimum(cells["soil"], len(self.soils) - 1)
+        water_codes = np.minimum(cells["water"], len(self.water_sources) - 1)
+        return {
+            "soil": self.soils[soil_codes],
+            "water_source": self.water_sources[water_codes],
+            "avg_rainfall": np.round(rain, 1),
+            "avg_temp": np.round(temp, 1),
+            "valid": valid,
+        }
+
+    def lookup(self, lat, lon, interpolate=False):
+        """Single point lookup; None when the point has no data."""
+        found = self.lookup_many([lat], [lon], interpolate)
+        if not found["valid"][0]:
+            return None
+        return {
+            "soil": found["soil"][0],
+            "avg_rainfall": float(found["avg_rainfall"][0]),
+            "avg_temp": float(found["avg_temp"][0]),
+            "water_source": found["water_source"][0],
+        }
+
+    def polygon_cells(self, polygon, max_cells=None):
+        """
+        Centres (lats, lons) of the grid cells whose centre lies inside a
+        (lat, lon) polygon. Raises ValueError if the polygon's bounding box
+        spans more than max_cells cells.
+        """
+        poly = np.asarray(polygon, dtype=float)
+        rows, cols, _ = self.cell_index(
+            [poly[:, 0].min(), poly[:, 0].max()], [poly[:, 1].min(), poly[:, 1].max()]
+        )
+        if max_cells is not None and (rows[1] - rows[0] + 1) * (cols[1] - cols[0] + 1) > max_cells:
+            raise ValueError("polygon covers too many cells")
+        r = np.arange(rows[0], rows[1] + 1)
+        c = np.arange(cols[0], cols[1] + 1)
+        lats = self.lat_min + (r + 0.5) * self.cell_size
+        lons = self.lon_min + (c + 0.5) * self.cell_size
+        grid_lat, grid_lon = np.meshgrid(lats, lons, indexing="ij")
+        y, x = grid_lat.ravel(), grid_lon.ravel()
+
+        # Even-odd ray casting, vectorised over every candidate cell
+        inside = np.zeros(y.shape, dtype=bool)
+        y0, x0 = poly[:, 0], poly[:, 1]
+        y1, x1 = np.roll(y0, -1), np.roll(x0, -1)
+        for ya, xa, yb, xb in zip(y0, x0, y1, x1):
+            crosses = (ya > y) != (yb > y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_at = xa + (y - ya) * (xb - xa) / (yb - ya)
+            inside ^= crosses & (x < x_at)
+        return y[inside], x[inside]
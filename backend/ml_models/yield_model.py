@@ -1,5 +1,18 @@
 # backend/ml_models/yield_model.py
 import random
+from typing import Optional
+import numpy as np
+
+# irrigation (lower-case) -> (yield multiplier, score adjustment)
+IRRIGATION_EFFECTS = {
+    "drip": (1.1, 3.0),
+    "manual": (0.9, -5.0),
+}
+# water_amount -> yield multiplier
+WATER_EFFECTS = {
+    "Low": 0.8,
+    "High": 1.05,
+}
 
 def predict_yield(params: dict) -> dict:
     """
@@ -9,19 +22,39 @@ def predict_yield(params: dict) -> dict:
     yield_base = random.uniform(2000, 5000)
     score_base = random.uniform(60, 95)
 
-    if params["irrigation"].lower() == "drip":
-        yield_base *= 1.1
-        score_base += 3
-    elif params["irrigation"].lower() == "manual":
-        yield_base *= 0.9
-        score_base -= 5
-
-    if params["water_amount"] == "Low":
-        yield_base *= 0.8
-    elif params["water_amount"] == "High":
-        yield_base *= 1.05
+    yield_mult, score_adj = IRRIGATION_EFFECTS.get(params["irrigation"].lower(), (1.0, 0.0))
+    yield_base *= yield_mult * WATER_EFFECTS.get(params["water_amount"], 1.0)
+    score_base += score_adj
 
     return {
         "yield_value": round(yield_base, 2),
         "score": round(min(max(score_base, 0), 100), 2),
     }
+
+def _lookup(values, table, default, transform=None):
+    """Maps a column of category strings through `table`, one dict lookup per distinct value."""
+    categories, inverse = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    keys = [transform(c) if transform else c for c in categories]
+    mapped = np.array([table.get(k, default) for k in keys], dtype=float)
+    return mapped[inverse]
+
+def predict_yield_batch(irrigation, water_amount, seed: Optional[int] = None) -> dict:
+    """
+    Vectorised predict_yield for many scenarios at once.
+    Takes one column per input the model uses (equal-length sequences) and
+    returns numpy arrays "yield_value" and "score". The same seed always
+    gives the same numbers.
+    """
+    n = len(irrigation)
+    rng = np.random.default_rng(seed)
+    yield_base = rng.uniform(2000, 5000, n)
+    score_base = rng.uniform(60, 95, n)
+
+    effects = _lookup(irrigation, {k: v[0] for k, v in IRRIGATION_EFFECTS.items()}, 1.0, str.lower)
+    adjust = _lookup(irrigation, {k: v[1] for k, v in IRRIGATION_EFFECTS.items()}, 0.0, str.lower)
+    water = _lookup(water_amount, WATER_EFFECTS, 1.0)
+
+    return {
+        "yield_value": np.round(yield_base * effects * water, 2),
+        "score": np.round(np.clip(score_base + adjust, 0, 100), 2),
+    }
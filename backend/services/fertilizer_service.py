@@ -1,13 +1,8 @@
+from services.rules import fertilizer_for
+
 def recommend(env: dict, ph: float):
     """
     Recommend fertilizer based on soil pH.
-    Mock logic for now.
+    Mock logic for now (pH bands in services/rules.py).
     """
-    if ph < 6.0:
-        rec = "Add lime to increase soil pH"
-    elif ph > 7.5:
-        rec = "Add sulfur to lower soil pH"
-    else:
-        rec = "Use nitrogen-rich fertilizer"
-
-    return {"ph": ph, "fertilizer": rec}
+    return {"ph": ph, "fertilizer": fertilizer_for(ph)}
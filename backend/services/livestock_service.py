@@ -1,13 +1,9 @@
+from services.rules import livestock_for
+
 def recommend(env: dict):
     """
     Recommend livestock based on climate.
-    Mock logic for now.
+    Mock logic for now (temperature bands in services/rules.py).
     """
     temp = env.get("temperature", 25)
-
-    if temp > 30:
-        recs = ["Goat", "Chicken"]
-    else:
-        recs = ["Cow", "Goat"]
-
-    return {"temperature": temp, "livestock": recs}
+    return {"temperature": temp, "livestock": livestock_for(temp)}
@@ -0,0 +1,100 @@
+# backend/services/plan_service.py
+"""
+A complete farm plan in one pass: the environment is resolved once, then
+crop, livestock, water-need, fertilizer and yield scoring all read from it.
+
+Plans are cached per environment cell and irrigation method. Yield scores
+are seeded from that key, so a cached plan is identical to a freshly
+computed one. The caller's exact area and pH only scale totals and pick
+fertilizer advice, so those are applied per request outside the cache.
+"""
+import zlib
+from functools import lru_cache
+from typing import Optional
+
+from ml_models.environment_model import FALLBACK_CELL_DEG, get_environment_prediction, get_raster
+from ml_models.yield_model import predict_yield_batch
+from services import rules
+
+PLAN_CACHE_SIZE = 4096
+
+
+def _location_key(lat: float, lon: float):
+    raster = get_raster()
+    if raster is not None:
+        rows, cols, inside = raster.cell_index([lat], [lon])
+        if inside[0]:
+            return ("raster", int(rows[0]), int(cols[0]))
+    return ("cell", round(lat / FALLBACK_CELL_DEG), round(lon / FALLBACK_CELL_DEG))
+
+
+def _cell_centre(location):
+    kind, row, col = location
+    if kind == "raster":
+        raster = get_raster()
+        return (raster.lat_min + (row + 0.5) * raster.cell_size,
+                raster.lon_min + (col + 0.5) * raster.cell_size)
+    return row * FALLBACK_CELL_DEG, col * FALLBACK_CELL_DEG
+
+
+def plan_key(lat: float, lon: float, irrigation: str):
+    """Requests with the same key share one cached plan."""
+    return _location_key(lat, lon), irrigation.strip().title()
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _plan(location, irrigation) -> dict:
+    lat, lon = _cell_centre(location)
+    env = get_environment_prediction(lat, lon)
+
+    crops = rules.crops_for(env["soil"])
+    water = [rules.water_for(crop) for crop in crops]
+    seed = zlib.crc32(repr((location, irrigation)).encode())
+    scores = predict_yield_batch([irrigation] * len(crops), [w[1] for w in water], seed=seed)
+
+    crop_plans = [
+        {
+            "crop": crop,
+            "water_need": need,
+            "water_amount": amount,
+            "yield_value": y,
+            "score": s,
+        }
+        for crop, (need, amount), y, s in zip(
+            crops, water, scores["yield_value"].tolist(), scores["score"].tolist()
+        )
+    ]
+    crop_plans.sort(key=lambda c: c["score"], reverse=True)
+
+    return {
+        "environment": env,
+        "irrigation": irrigation,
+        "crops": crop_plans,
+        "livestock": rules.livestock_for(env["avg_temp"]),
+    }
+
+
+def farm_plan(lat: float, lon: float, ph: Optional[float] = None,
+              irrigation: str = "Drip", area: float = 1.0) -> dict:
+    """
+    Full plan for a plot: environment, crops ranked by sustainability score
+    (with water need and predicted yield), livestock and fertilizer advice.
+    Nested values are shared with the cache; don't modify them.
+    """
+    plan = _plan(*plan_key(lat, lon, irrigation))
+    if ph is None:
+        ph = rules.soil_ph(plan["environment"]["soil"])
+    return {
+        **plan,
+        "area": area,
+        "crops": [{**c, "total_yield": round(c["yield_value"] * area, 2)} for c in plan["crops"]],
+        "fertilizer": {"ph": ph, "recommendation": rules.fertilizer_for(ph)},
+    }
+
+
+def cache_info():
+    return _plan.cache_info()
+
+
+def clear_cache():
+    _plan.cache_clear()
@@ -0,0 +1,96 @@
+# backend/services/rules.py
+"""
+Recommendation rules, compiled once at import into lookup tables so a plan
+is a handful of dict lookups and binary searches instead of chained if/else.
+
+Numeric rules become sorted band boundaries searched with bisect on the
+exact input, so the tables agree with the rule functions at every value,
+including on the boundaries themselves.
+"""
+from bisect import bisect_left
+
+from ml_models.environment_model import CROPS_BY_SOIL, DEFAULT_CROPS
+
+# Typical topsoil pH per soil class, used when the caller doesn't measure it
+SOIL_PH = {"sandy": 5.8, "loamy": 6.6, "clay": 7.8}
+DEFAULT_PH = 6.5
+
+# crop (lower-case) -> seasonal water need
+WATER_NEED = {"rice": "high", "sugarcane": "high", "millet": "low", "groundnut": "low"}
+DEFAULT_WATER_NEED = "medium"
+# water need -> water_amount understood by the yield model
+WATER_AMOUNT = {"low": "Low", "medium": "Medium", "high": "High"}
+
+
+LIVESTOCK_TEMP_EDGES = [30]
+FERTILIZER_PH_EDGES = [6.0, 7.5]
+
+
+def _livestock_rule(temp):
+    return ["Goat", "Chicken"] if temp > 30 else ["Cow", "Goat"]
+
+
+def _fertilizer_rule(ph):
+    if ph < 6.0:
+        return "Add lime to increase soil pH"
+    if ph > 7.5:
+        return "Add sulfur to lower soil pH"
+    return "Use nitrogen-rich fertilizer"
+
+
+class Bands:
+    """
+    A piecewise-constant rule compiled against its sorted boundaries: one
+    result per open interval between edges and one per edge, so a lookup
+    is a bisect plus an equality check.
+    """
+
+    def __init__(self, rule, edges):
+        self.edges = sorted(edges)
+        probes = [self.edges[0] - 1]
+        probes += [(a + b) / 2 for a, b in zip(self.edges, self.edges[1:])]
+        probes.append(self.edges[-1] + 1)
+        self.between = [rule(v) for v in probes]  # interval i lies below edges[i]
+        self.at_edge = [rule(e) for e in self.edges]
+
+    def __call__(self, value):
+        i = bisect_left(self.edges, value)
+        if i < len(self.edges) and self.edges[i] == value:
+            return self.at_edge[i]
+        return self.between[i]
+
+
+LIVESTOCK_BY_TEMP = Bands(_livestock_rule, LIVESTOCK_TEMP_EDGES)
+FERTILIZER_BY_PH = Bands(_fertilizer_rule, FERTILIZER_PH_EDGES)
+# crop -> (water need, water_amount), one entry per crop the tables can recommend
+CROP_WATER = {
+    crop: (WATER_NEED.get(crop.lower(), DEFAULT_WATER_NEED),
+           WATER_AMOUNT[WATER_NEED.get(crop.lower(), DEFAULT_WATER_NEED)])
+    for crops in list(CROPS_BY_SOIL.values()) + [DEFAULT_CROPS]
+    for crop in crops
+}
+
+
+def crops_for(soil):
+    return CROPS_BY_SOIL.get(soil, DEFAULT_CROPS)
+
+
+def livestock_for(temp):
+    return LIVESTOCK_BY_TEMP(temp)
+
+
+def fertilizer_for(ph):
+    return FERTILIZER_BY_PH(ph)
+
+
+def water_for(crop):
+    """(water need, water_amount) for a crop."""
+    found = CROP_WATER.get(crop)
+    if found is None:
+        need = WATER_NEED.get(crop.lower(), DEFAULT_WATER_NEED)
+        found = (need, WATER_AMOUNT[need])
+    return found
+
+
+def soil_ph(soil):
+    return SOIL_PH.get(soil, DEFAULT_PH)
@@ -1,16 +1,11 @@
+from services.rules import water_for
+
 def predict(env: dict):
     """
     Predict water requirement for crops.
-    Mock logic for now.
+    Mock logic for now (per-crop table in services/rules.py).
     """
     crop = env.get("crop", "Wheat")
     rainfall = env.get("rainfall", 600)
-
-    if crop.lower() == "rice":
-        need = "high"
-    elif crop.lower() == "millet":
-        need = "low"
-    else:
-        need = "medium"
-
+    need, _ = water_for(crop)
     return {"crop": crop, "rainfall": rainfall, "water_need": need}
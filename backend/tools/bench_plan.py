@@ -0,0 +1,73 @@
+"""
+Latency of one /analyze/plan call against the chain of per-service calls
+a client would otherwise make for the same plan (environment, crops,
+livestock, water per crop, fertilizer, simulate per crop), in-process via
+TestClient.
+
+Run from the backend folder:
+    python -m tools.bench_plan --plots 500
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+from main import app
+from services import plan_service
+from services.rules import soil_ph
+
+
+def plots(n, seed=7):
+    rng = random.Random(seed)
+    return [(rng.uniform(8, 37), rng.uniform(68, 97)) for _ in range(n)]
+
+
+def chain(client, lat, lon, irrigation="Drip"):
+    env = client.post("/analyze/environment", json={"latitude": lat, "longitude": lon}).json()
+    crops = client.post("/analyze/crops", json={
+        "soil": env["soil"], "rainfall": env["avg_rainfall"], "temperature": env["avg_temp"],
+    }).json()["recommendations"]
+    client.post("/analyze/livestock", json={"temperature": env["avg_temp"]}).raise_for_status()
+    client.post("/analyze/fertilizer", json={"ph": soil_ph(env["soil"])}).raise_for_status()
+    for crop in crops:
+        need = client.post("/analyze/water", json={"crop": crop, "rainfall": env["avg_rainfall"]}).json()
+        client.post("/analyze/simulate", json={
+            "crop": crop, "livestock": "Cow", "water_amount": need["predicted_water_need"].title(),
+            "irrigation": irrigation, "soil": env["soil"], "temp": env["avg_temp"], "rainfall": env["avg_rainfall"],
+        }).raise_for_status()
+
+
+def timed(fn, items):
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        fn(*item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return np.percentile(samples, [50, 99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plots", type=int, default=500)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    items = plots(args.plots)
+
+    def plan(lat, lon):
+        client.post("/analyze/plan", json={"latitude": lat, "longitude": lon}).raise_for_status()
+
+    chain_ms = timed(lambda lat, lon: chain(client, lat, lon), items)
+    plan_service.clear_cache()
+    cold_ms = timed(plan, items)
+    warm_ms = timed(plan, items)
+
+    print(f"chain of calls:    p50 {chain_ms[0]:6.2f} ms  p99 {chain_ms[1]:6.2f} ms")
+    print(f"plan (uncached):   p50 {cold_ms[0]:6.2f} ms  p99 {cold_ms[1]:6.2f} ms")
+    print(f"plan (cached):     p50 {warm_ms[0]:6.2f} ms  p99 {warm_ms[1]:6.2f} ms")
+    print(f"plan cache: {plan_service.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
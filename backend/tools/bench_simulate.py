@@ -0,0 +1,60 @@
+"""
+Throughput of /analyze/simulate (one scenario per request) against
+/analyze/simulate/batch for the same scenarios, in-process via TestClient.
+
+Run from the backend folder:
+    python -m tools.bench_simulate --scenarios 1000
+"""
+import argparse
+import time
+from itertools import product
+
+from fastapi.testclient import TestClient
+from main import app
+
+CROPS = ["Rice", "Wheat", "Maize", "Millet", "Pulses", "Sugarcane", "Groundnut", "Cotton"]
+LIVESTOCK = ["Cow", "Goat", "Chicken", "Buffalo", "Sheep"]
+WATER = ["Low", "Medium", "High"]
+IRRIGATION = ["Drip", "Sprinkler", "Manual", "Canal"]
+
+
+def scenarios(n):
+    base = {"soil": "loamy", "temp": 27.0, "rainfall": 700.0}
+    combos = list(product(CROPS, LIVESTOCK, WATER, IRRIGATION))
+    return [
+        {"crop": c, "livestock": l, "water_amount": w, "irrigation": i, **base}
+        for c, l, w, i in (combos[k % len(combos)] for k in range(n))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    items = scenarios(args.scenarios)
+
+    start = time.perf_counter()
+    for item in items:
+        client.post("/analyze/simulate", json=item).raise_for_status()
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    client.post("/analyze/simulate/batch", json={"scenarios": items, "seed": 1}).raise_for_status()
+    batch = time.perf_counter() - start
+
+    grid = {"crop": CROPS, "livestock": LIVESTOCK, "water_amount": WATER, "irrigation": IRRIGATION,
+            "soil": "loamy", "temp": 27.0, "rainfall": 700.0}
+    start = time.perf_counter()
+    client.post("/analyze/simulate/batch", json={"grid": grid, "seed": 1, "top_k": 10}).raise_for_status()
+    grid_ms = (time.perf_counter() - start) * 1000
+
+    n = len(items)
+    print(f"per-request endpoint: {n / single:10.0f} scenarios/s ({single * 1000:.0f} ms for {n})")
+    print(f"batch endpoint:       {n / batch:10.0f} scenarios/s ({batch * 1000:.0f} ms for {n})")
+    print(f"grid top-10 of {len(CROPS) * len(LIVESTOCK) * len(WATER) * len(IRRIGATION)} combos: {grid_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
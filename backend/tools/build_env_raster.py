@@ -0,0 +1,120 @@
+"""
+Builds the environment raster read by ml_models/environment_raster.py.
+
+Run from the backend folder, with one of three sources:
+
+    # Gridded points: lat,lon,soil,avg_rainfall,avg_temp,water_source
+    python -m tools.build_env_raster --csv points.csv --cell-size 0.05
+
+    # One .npy per layer (soil.npy, water.npy as category codes; rain.npy, temp.npy),
+    # row 0 at --lat-min
+    python -m tools.build_env_raster --npy-dir layers/ --lat-min 8 --lon-min 68 --cell-size 0.05
+
+    # Smooth synthetic grid for offline testing
+    python -m tools.build_env_raster --synthetic --bounds 8 37 68 97 --cell-size 0.05
+
+The output defaults to data/environment.kpr, where the API looks for it
+(override with KRISHIPATHA_ENV_RASTER).
+"""
+import argparse
+import csv
+import os
+
+import numpy as np
+
+from ml_models.environment_raster import write_raster, NODATA, SOIL_CLASSES, WATER_SOURCES
+from ml_models.environment_model import RASTER_PATH
+
+
+def from_csv(path, cell_size):
+    with open(path, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    if not rows:
+        raise SystemExit(f"{path} has no rows")
+    lats = np.array([float(r["lat"]) for r in rows])
+    lons = np.array([float(r["lon"]) for r in rows])
+    lat_min = np.floor(lats.min() / cell_size) * cell_size
+    lon_min = np.floor(lons.min() / cell_size) * cell_size
+    r = np.floor((lats - lat_min) / cell_size + 1e-9).astype(int)
+    c = np.floor((lons - lon_min) / cell_size + 1e-9).astype(int)
+    shape = (r.max() + 1, c.max() + 1)
+
+    soils = sorted({row["soil"] for row in rows} | set(SOIL_CLASSES), key=_category_order(SOIL_CLASSES))
+    waters = sorted({row["water_source"] for row in rows} | set(WATER_SOURCES), key=_category_order(WATER_SOURCES))
+    soil = np.full(shape, NODATA, dtype=np.uint8)
+    water = np.full(shape, NODATA, dtype=np.uint8)
+    rain = np.full(shape, np.nan, dtype=np.float32)
+    temp = np.full(shape, np.nan, dtype=np.float32)
+    soil[r, c] = [soils.index(row["soil"]) for row in rows]
+    water[r, c] = [waters.index(row["water_source"]) for row in rows]
+    rain[r, c] = [float(row["avg_rainfall"]) for row in rows]
+    temp[r, c] = [float(row["avg_temp"]) for row in rows]
+    return dict(lat_min=lat_min, lon_min=lon_min, soil=soil, water=water, rain=rain, temp=temp,
+                soils=soils, water_sources=waters)
+
+
+def _category_order(known):
+    # Keep the built-in classes at their usual codes, extra ones after them
+    return lambda name: (known.index(name) if name in known else len(known), name)
+
+
+def from_npy(folder, lat_min, lon_min):
+    layers = {name: np.load(os.path.join(folder, f"{name}.npy")) for name in ("soil", "water", "rain", "temp")}
+    shapes = {a.shape for a in layers.values()}
+    if len(shapes) != 1:
+        raise SystemExit(f"layer shapes differ: {shapes}")
+    for name, classes in (("soil", SOIL_CLASSES), ("water", WATER_SOURCES)):
+        codes = layers[name]
+        bad = np.unique(codes[(codes >= len(classes)) & (codes != NODATA)])
+        if bad.size:
+            raise SystemExit(f"{name}.npy has codes {bad.tolist()} outside 0..{len(classes) - 1} (or {NODATA} for no data)")
+    return dict(lat_min=lat_min, lon_min=lon_min, **layers)
+
+
+def synthetic(bounds, cell_size, seed=0):
+    lat_min, lat_max, lon_min, lon_max = bounds
+    nrows = int(np.ceil((lat_max - lat_min) / cell_size))
+    ncols = int(np.ceil((lon_max - lon_min) / cell_size))
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 1, nrows)[:, None]
+    x = np.linspace(0, 1, ncols)[None, :]
+    phase = rng.uniform(0, 2 * np.pi, 4)
+    wave = np.sin(6 * x + phase[0]) * np.cos(5 * y + phase[1])
+    rain = (650 + 250 * wave + 80 * np.sin(11 * y + phase[2])).astype(np.float32)
+    temp = (35 - 15 * y + 2 * np.cos(9 * x + phase[3])).astype(np.float32)
+    soil = np.digitize(wave, [-0.33, 0.33]).astype(np.uint8)  # sandy / loamy / clay
+    water = np.where(rain > 800, 0, np.where(rain > 550, 1, 2)).astype(np.uint8)
+    return dict(lat_min=lat_min, lon_min=lon_min, soil=soil, water=water, rain=rain, temp=temp)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the environment raster")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv")
+    source.add_argument("--npy-dir")
+    source.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--cell-size", type=float, required=True, help="cell size in degrees")
+    parser.add_argument("--lat-min", type=float)
+    parser.add_argument("--lon-min", type=float)
+    parser.add_argument("--bounds", type=float, nargs=4, metavar=("LAT_MIN", "LAT_MAX", "LON_MIN", "LON_MAX"))
+    parser.add_argument("--out", default=RASTER_PATH)
+    args = parser.parse_args()
+
+    if args.csv:
+        grid = from_csv(args.csv, args.cell_size)
+    elif args.npy_dir:
+        if args.lat_min is None or args.lon_min is None:
+            parser.error("--npy-dir needs --lat-min and --lon-min")
+        grid = from_npy(args.npy_dir, args.lat_min, args.lon_min)
+    else:
+        if not args.bounds:
+            parser.error("--synthetic needs --bounds")
+        grid = synthetic(args.bounds, args.cell_size)
+
+    write_raster(args.out, cell_size=args.cell_size, **grid)
+    nrows, ncols = grid["soil"].shape
+    print(f"Wrote {nrows}x{ncols} cells to {args.out} ({os.path.getsize(args.out) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
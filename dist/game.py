@@ -1,8 +1,17 @@
-import pygame
+import os
 import sys
+
+# Headless benchmark: replay a scripted tour on SDL's dummy driver and print frame timings
+BENCHMARK = "--benchmark" in sys.argv
+if BENCHMARK:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
 from screens.landing import LandingPage
 from screens.explore import ExplorePage
 from screens.challenge import ChallengePage
+from screens.compositor import run_loop, FrameProfiler
 
 # Initialize pygame
 pygame.init()
@@ -12,30 +21,21 @@ WIDTH, HEIGHT = 900, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("🌱 KrishiPatha")
 
-# Clock
-clock = pygame.time.Clock()
-
-# Screen manager
-def set_screen(new_screen):
-    global current_screen
-    current_screen = new_screen
-
-# Start with landing page
-current_screen = LandingPage(screen, set_screen)
+# Per-screen handle_event/update/draw timings; set KRISHIPATHA_PROFILE=1 to print them on exit
+profiler = FrameProfiler() if BENCHMARK or os.environ.get("KRISHIPATHA_PROFILE") else None
 
-# Game loop
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
+script = None
+if BENCHMARK:
+    from screens.benchmark import ScriptedInput, TOUR
+    script = ScriptedInput(TOUR)
 
-        # Pass events to current screen
-        current_screen.handle_event(event)
+# Start with landing page; 30 FPS while animating, throttled when the screen is idle
+run_loop(screen, lambda set_screen: LandingPage(screen, set_screen), fps=30, profiler=profiler, script=script)
 
-    # Update and draw
-    current_screen.update()
-    current_screen.draw()
+if profiler:
+    profiler.report(WIDTH * HEIGHT)
+if script and script.failed:
+    print("Benchmark stopped early:", script.failed)
 
-    pygame.display.flip()
-    clock.tick(30)   # 30 FPS for smooth playback
+pygame.quit()
+sys.exit(1 if script and script.failed else 0)
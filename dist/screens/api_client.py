@@ -0,0 +1,107 @@
+# ---- Non-blocking client for the game's backend calls ----
+import os
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+# Point these at the local FastAPI app (cd backend && uvicorn main:app) with e.g.
+#   KRISHIPATHA_BACKEND_URL=http://127.0.0.1:8000/analyze/environment
+#   KRISHIPATHA_RESULTS_URL=http://127.0.0.1:8000/analyze/simulate
+BACKEND_URL = os.environ.get("KRISHIPATHA_BACKEND_URL", "https://nasa-space-app-models.onrender.com/predict")
+RESULTS_URL = os.environ.get("KRISHIPATHA_RESULTS_URL", "https://nasa-space-app-models.onrender.com/predict")
+
+ENV_CELL_DEG = 0.05  # environment responses are cached per grid cell of this size
+
+
+def env_cell(lat, lon, cell_deg=ENV_CELL_DEG):
+    return round(lat / cell_deg), round(lon / cell_deg)
+
+
+class ApiClient:
+    """
+    Runs backend calls on a worker pool over one pooled session and hands
+    back Futures that screens poll from update() (fut.done() / fut.result()).
+    Identical requests that are already in flight share one Future, and
+    successful responses with a cache key are kept in a small LRU. A failed
+    call resolves to None instead of raising, and is not cached.
+    """
+
+    def __init__(self, workers=4, timeout=15, cache_size=256):
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-client")
+        self._lock = threading.Lock()
+        self._in_flight = {}  # request key -> Future
+        self._cache = OrderedDict()  # cache key -> response data
+
+        # Benchmark counters
+        self.requests = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    def post(self, url, payload, cache_key=None, timeout=None):
+        """Queues a POST and returns a Future for the decoded JSON (or None on failure)."""
+        request_key = cache_key if cache_key is not None else (url, json.dumps(payload, sort_keys=True))
+        with self._lock:
+            if cache_key is not None and cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                done = Future()
+                done.set_result(self._cache[cache_key])
+                return done
+            fut = self._in_flight.get(request_key)
+            if fut is not None:
+                self.coalesced += 1
+                return fut
+            fut = self._executor.submit(self._post, url, payload, timeout or self.timeout)
+            self._in_flight[request_key] = fut
+            self.requests += 1
+        fut.add_done_callback(lambda f: self._finished(request_key, cache_key, f))
+        return fut
+
+    def _post(self, url, payload, timeout):
+        try:
+            resp = self._session.post(url, json=payload, timeout=timeout)
+            if resp.status_code == 200:
+                return resp.json()
+            print("Backend responded with status:", resp.status_code)
+        except Exception as e:
+            print("Error contacting backend:", e)
+        return None
+
+    def _finished(self, request_key, cache_key, fut):
+        with self._lock:
+            self._in_flight.pop(request_key, None)
+            data = fut.result()
+            if cache_key is not None and data is not None:
+                self._cache[cache_key] = data
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    # ---------- game endpoints ----------
+    def environment(self, lat, lon):
+        """Environment + recommendations for the grid cell containing (lat, lon)."""
+        cell = env_cell(lat, lon)
+        payload = {"latitude": cell[0] * ENV_CELL_DEG, "longitude": cell[1] * ENV_CELL_DEG}
+        return self.post(BACKEND_URL, payload, cache_key=("environment", cell), timeout=10)
+
+    def prefetch_environment(self, lat, lon):
+        """Warms the cache for a cell the player is likely to pick (e.g. the map centre)."""
+        self.environment(lat, lon)
+
+    def simulation_results(self, payload):
+        return self.post(RESULTS_URL, payload, timeout=15)
+
+    def stats(self):
+        return {"requests": self.requests, "coalesced": self.coalesced, "cache_hits": self.cache_hits,
+                "in_flight": len(self._in_flight), "cached": len(self._cache)}
+
+
+api = ApiClient()
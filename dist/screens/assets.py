@@ -0,0 +1,278 @@
+# ---- Shared asset manager: images and background frame sequences ----
+import os
+import re
+import json
+import time
+import zlib
+import struct
+import threading
+from collections import OrderedDict
+
+import pygame
+
+_default_pack_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "cache", "frames"))
+
+# Set KRISHIPATHA_ASSET_CACHE to an empty string to stop writing frame packs.
+ASSET_PACK_DIR = os.environ.get("KRISHIPATHA_ASSET_CACHE", _default_pack_dir)
+ASSET_MEMORY_MB = float(os.environ.get("KRISHIPATHA_ASSET_MEMORY_MB", "256"))
+
+PACK_MAGIC = b"KPFRAMES1\n"
+IMAGE_EXTENSIONS = (".png", ".jpg")
+
+
+def numerical_sort(value):
+    numbers = re.findall(r'\d+', value)
+    return int(numbers[0]) if numbers else -1
+
+
+def _display_format(surf, alpha):
+    if pygame.display.get_surface() is None:
+        return surf  # no window yet (tools, headless benchmarks)
+    return surf.convert_alpha() if alpha else surf.convert()
+
+
+def _surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+class FrameSequence:
+    """
+    A folder of background frames scaled to one size. Frames are decoded on a
+    background thread (from the pre-scaled pack when there is a valid one) and
+    become available one by one, so a screen can start animating before the
+    whole sequence is in memory.
+    """
+
+    def __init__(self, folder, size, pack_dir=ASSET_PACK_DIR):
+        self.folder = folder
+        self.size = size
+        self.files = []
+        if os.path.exists(folder):
+            self.files = sorted((f for f in os.listdir(folder) if f.endswith(IMAGE_EXTENSIONS)), key=numerical_sort)
+
+        self._frames = [None] * len(self.files)
+        self._converted = [False] * len(self.files)
+        self._lock = threading.Lock()
+        self.loaded = 0
+        self.bytes = 0
+        self.from_pack = False
+        self.started = time.perf_counter()
+        self.first_frame_ms = None
+        self.load_ms = None
+
+        self.pack_path = None
+        if pack_dir:
+            name = f"{os.path.basename(os.path.normpath(folder))}_{size[0]}x{size[1]}.pack"
+            self.pack_path = os.path.join(pack_dir, name)
+
+        self._thread = threading.Thread(target=self._load_all, name=f"frames-{os.path.basename(folder)}", daemon=True)
+        self._thread.start()
+
+    def __len__(self):
+        return len(self.files)
+
+    @property
+    def expected_bytes(self):
+        """What the sequence will hold once every frame is loaded and converted (32-bit pixels)."""
+        return len(self.files) * self.size[0] * self.size[1] * 4
+
+    @property
+    def complete(self):
+        return self.loaded == len(self.files)
+
+    def get(self, index):
+        """
+        Frame `index` in display format, or the closest earlier frame that has
+        finished loading. None until the first frame is ready.
+        """
+        if not self.files:
+            return None
+        for i in range(index, -1, -1):
+            frame = self._frames[i]
+            if frame is not None:
+                if not self._converted[i]:
+                    # convert() has to happen on the render thread
+                    converted = _display_format(frame, alpha=False)
+                    with self._lock:
+                        self.bytes += _surface_bytes(converted) - _surface_bytes(frame)
+                        self._frames[i] = frame = converted
+                        self._converted[i] = True
+                return frame
+        return None
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+
+    # ---------- loader thread ----------
+    def _sources(self):
+        sources = []
+        for f in self.files:
+            st = os.stat(os.path.join(self.folder, f))
+            sources.append([f, st.st_mtime_ns, st.st_size])
+        return sources
+
+    def _store(self, i, surf):
+        with self._lock:
+            self._frames[i] = surf
+            self.bytes += _surface_bytes(surf)
+            self.loaded += 1
+        if self.first_frame_ms is None:
+            self.first_frame_ms = (time.perf_counter() - self.started) * 1000
+
+    def _load_all(self):
+        sources = self._sources()
+        if not (self.pack_path and self._load_pack(sources)):
+            for i, f in enumerate(self.files):
+                try:
+                    img = pygame.image.load(os.path.join(self.folder, f))
+                    self._store(i, pygame.transform.scale(img, self.size))
+                except pygame.error as e:
+                    print(f"Failed to load frame {f}: {e}")
+                    self._store(i, pygame.Surface(self.size))
+            if self.pack_path:
+                self._write_pack(sources)
+        self.load_ms = (time.perf_counter() - self.started) * 1000
+
+    def _load_pack(self, sources):
+        try:
+            with open(self.pack_path, "rb") as fh:
+                if fh.read(len(PACK_MAGIC)) != PACK_MAGIC:
+                    return False
+                (header_len,) = struct.unpack("<I", fh.read(4))
+                header = json.loads(fh.read(header_len))
+                if header["size"] != list(self.size) or header["sources"] != sources:
+                    return False  # frames changed on disk; rebuild the pack
+                data_start = len(PACK_MAGIC) + 4 + header_len
+                for i, (offset, length) in enumerate(header["offsets"]):
+                    fh.seek(data_start + offset)
+                    raw = zlib.decompress(fh.read(length))
+                    self._store(i, pygame.image.fromstring(raw, self.size, "RGB"))
+        except (OSError, ValueError, KeyError, zlib.error, struct.error, pygame.error):
+            # Damaged pack: forget anything it gave us and decode the sources
+            with self._lock:
+                self._frames = [None] * len(self.files)
+                self._converted = [False] * len(self.files)
+                self.loaded = 0
+                self.bytes = 0
+            return False
+        self.from_pack = True
+        return True
+
+    def _write_pack(self, sources):
+        # Raw RGB at display size, lightly compressed: inflating is far
+        # cheaper than decoding and rescaling the full-size PNGs.
+        blobs = [zlib.compress(pygame.image.tostring(s, "RGB"), 1) for s in self._frames]
+        offsets, offset = [], 0  # relative to the end of the header
+        for blob in blobs:
+            offsets.append([offset, len(blob)])
+            offset += len(blob)
+        header = {"size": list(self.size), "sources": sources, "offsets": offsets}
+        encoded = json.dumps(header).encode()
+        tmp = self.pack_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.pack_path), exist_ok=True)
+            with open(tmp, "wb") as fh:
+                fh.write(PACK_MAGIC)
+                fh.write(struct.pack("<I", len(encoded)))
+                fh.write(encoded)
+                for blob in blobs:
+                    fh.write(blob)
+            os.replace(tmp, self.pack_path)
+        except OSError as e:
+            print("Could not write frame pack:", e)
+
+
+class AssetManager:
+    """
+    Process-wide cache of display-format images and frame sequences, keyed by
+    (path, size). Entries are dropped least-recently-used first once their
+    pixels exceed budget_bytes; a screen that still holds one keeps using it.
+    Frame sequences are charged their full expected size from the moment they
+    are inserted, since their frames arrive later on a background thread.
+    """
+
+    def __init__(self, budget_bytes=int(ASSET_MEMORY_MB * 1024 * 1024), pack_dir=ASSET_PACK_DIR):
+        self.budget_bytes = budget_bytes
+        self.pack_dir = pack_dir
+        self._cache = OrderedDict()  # (kind, path, size, alpha) -> Surface | FrameSequence
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_ms = 0.0
+
+    def image(self, path, size=None, alpha=False):
+        """Loads, scales and converts an image once; later calls are dictionary lookups."""
+        key = ("image", os.path.abspath(path), tuple(size) if size else None, alpha)
+        surf = self._lookup(key)
+        if surf is None:
+            start = time.perf_counter()
+            surf = pygame.image.load(path)
+            if size:
+                surf = pygame.transform.scale(surf, size)
+            surf = _display_format(surf, alpha)
+            self.load_ms += (time.perf_counter() - start) * 1000
+            self._insert(key, surf)
+        return surf
+
+    def frames(self, folder, size):
+        """Returns the (possibly still loading) FrameSequence for a folder of frames."""
+        key = ("frames", os.path.abspath(folder), tuple(size), False)
+        seq = self._lookup(key)
+        if seq is None:
+            seq = FrameSequence(os.path.abspath(folder), tuple(size), self.pack_dir)
+            self._insert(key, seq)
+        return seq
+
+    def _lookup(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _insert(self, key, entry):
+        self._cache[key] = entry
+        self.trim(keep=key)
+
+    @staticmethod
+    def _entry_bytes(entry):
+        if isinstance(entry, FrameSequence):
+            return max(entry.bytes, entry.expected_bytes)
+        return _surface_bytes(entry)
+
+    def used_bytes(self):
+        return sum(self._entry_bytes(e) for e in self._cache.values())
+
+    def trim(self, keep=None):
+        used = self.used_bytes()
+        for key in list(self._cache):
+            if used <= self.budget_bytes:
+                break
+            if key == keep:
+                continue
+            entry = self._cache.pop(key)
+            used -= self._entry_bytes(entry)
+            self.evictions += 1
+
+    def stats(self):
+        sequences = {
+            os.path.basename(k[1]): {
+                "frames": len(e), "loaded": e.loaded, "from_pack": e.from_pack,
+                "first_frame_ms": e.first_frame_ms, "load_ms": e.load_ms,
+            }
+            for k, e in self._cache.items() if isinstance(e, FrameSequence)
+        }
+        return {
+            "entries": len(self._cache),
+            "bytes": self.used_bytes(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "image_load_ms": round(self.load_ms, 1),
+            "sequences": sequences,
+        }
+
+
+assets = AssetManager()
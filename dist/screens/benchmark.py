@@ -0,0 +1,145 @@
+# ---- Scripted input for the headless benchmark (python game.py --benchmark) ----
+import time
+
+import pygame
+
+# Steps run in order, one action per frame:
+#   ("wait", seconds)
+#   ("until", ScreenName or predicate(screen), timeout_seconds)
+#   ("click", (x, y) or position(screen))
+#   ("drag", (x, y), (x, y))
+# Positions may be callables so steps can target rects laid out in draw().
+
+
+def _first_rect(attr):
+    return lambda s: getattr(s, attr)[0][-1].center
+
+
+def _popup(button):
+    return lambda s: s._popup_buttons[button].center
+
+
+def _option(index, top=150, spacing=90):
+    return 450, top + index * spacing + 25
+
+
+def _state(name):
+    return lambda s: getattr(s, "state", None) == name
+
+
+def _quiz(count, spacing):
+    steps = [("until", _state("quiz"), 10)]
+    for _ in range(count):
+        steps += [("click", _option(0, spacing=spacing)), ("wait", 1.4)]
+    return steps + [("until", _state("result"), 5), ("wait", 1.0)]
+
+
+# LandingPage -> Explore* -> ExploreResults -> LandingPage -> ChallengePage -> Level1 -> Level2 -> Level3
+TOUR = [
+    ("wait", 1.0),
+    ("click", lambda s: s.learn_button.center),
+    ("until", "ExplorePage", 5), ("wait", 0.5),
+    ("click", lambda s: s.start_btn.center),
+    ("until", "ExploreMap", 5), ("wait", 0.5),
+    ("drag", (400, 300), (470, 330)), ("wait", 0.5),
+    ("click", (300, 250)), ("wait", 0.3),
+    ("click", lambda s: s.next_btn.center),
+    ("until", "ExplorePlot", 20),
+    ("click", (420, 200)), ("click", (360, 360)), ("wait", 0.3),
+    ("click", lambda s: s.finish_btn.center),
+    ("until", "ExploreStageLearning", 5), ("wait", 0.5),
+    ("click", _first_rect("crop_rects")), ("wait", 0.3),
+    ("click", _popup("choose")), ("wait", 0.3),
+    ("click", _first_rect("livestock_rects")), ("wait", 0.3),
+    ("click", _popup("choose")), ("wait", 0.5),
+    ("click", lambda s: s.next_btn.center),
+    ("until", "ExploreWaterAndProcess", 5), ("wait", 0.3),
+    ("click", lambda s: s.buttons[1][2].center), ("wait", 0.3),
+    ("click", _popup("choose")), ("wait", 0.3),
+    ("click", lambda s: s.buttons[3][2].center), ("wait", 0.3),
+    ("click", _popup("choose")), ("wait", 0.3),
+    ("click", lambda s: s.next_btn.center),
+    ("until", "ExploreResults", 40), ("wait", 1.5),
+    ("click", lambda s: s.home_btn.center),
+    ("until", "LandingPage", 5), ("wait", 0.5),
+    ("click", lambda s: s.challenge_button.center),
+    ("until", "ChallengePage", 5), ("wait", 0.5),
+    ("click", lambda s: s.level_buttons[0][1].center),
+    ("until", "Level1", 5), ("wait", 0.5),
+    ("click", (195, 445)), ("wait", 0.5),  # Wheat
+    ("click", (575, 445)), ("wait", 0.5),  # Drip
+    ("click", (400, 475)),  # Harvest
+    *_quiz(3, spacing=100),
+    ("click", lambda s: s.next_level_button_rect.center),
+    ("until", "Level2", 5),
+    *_quiz(5, spacing=90),
+    ("click", lambda s: s.back_button_rect.center),
+    ("until", "ChallengePage", 5), ("wait", 0.5),
+    ("click", lambda s: s.level_buttons[2][1].center),
+    ("until", "Level3", 5),
+    *_quiz(5, spacing=90),
+]
+
+
+class ScriptedInput:
+    """Turns a list of steps into pygame events, paced by wall-clock time."""
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.index = 0
+        self.step_started = None
+        self.finished = False
+        self.failed = None  # description of the step that timed out
+
+    def _matches(self, target, screen):
+        if callable(target):
+            return target(screen)
+        return type(screen).__name__ == target
+
+    def _pos(self, pos, screen):
+        return tuple(pos(screen)) if callable(pos) else pos
+
+    def _next(self):
+        self.index += 1
+        self.step_started = None
+        if self.index >= len(self.steps):
+            self.finished = True
+
+    def events(self, screen):
+        if self.finished:
+            return []
+        now = time.time()
+        if self.step_started is None:
+            self.step_started = now
+        step = self.steps[self.index]
+        kind = step[0]
+
+        if kind == "wait":
+            if now - self.step_started >= step[1]:
+                self._next()
+            return []
+
+        if kind == "until":
+            if self._matches(step[1], screen):
+                self._next()
+            elif now - self.step_started > step[2]:
+                self.failed = f"step {self.index}: {step[1]} not reached on {type(screen).__name__}"
+                self.finished = True
+            return []
+
+        events = []
+        if kind == "click":
+            pos = self._pos(step[1], screen)
+            events = [
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1),
+            ]
+        elif kind == "drag":
+            (x0, y0), (x1, y1) = step[1], step[2]
+            events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x0, y0), button=1)]
+            for i in range(1, 11):
+                x, y = x0 + (x1 - x0) * i // 10, y0 + (y1 - y0) * i // 10
+                events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(1, 0, 0)))
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(x1, y1), button=1))
+        self._next()
+        return events
@@ -1,29 +1,20 @@
-import pygame, os, re
+import pygame, os
+from screens.assets import assets
+from screens.text import get_font, render_text
 
 class ChallengePage:
     def __init__(self, screen, set_screen_callback):
         self.screen = screen
         self.set_screen = set_screen_callback
-        self.font = pygame.font.SysFont("Arial", 28, bold=True)
+        self.font = get_font("Arial", 28, bold=True)
         
         # Build relative folder path for challenge background frames
         base_path = os.path.dirname(__file__)  
         folder = os.path.join(base_path, "..", "assets", "challenge_bg")
         folder = os.path.abspath(folder)
 
-        # Sort frames numerically
-        def numerical_sort(value):
-            numbers = re.findall(r'\d+', value)
-            return int(numbers[0]) if numbers else -1
-
-        # Load frames
-        self.frames = []
-        if os.path.exists(folder):
-            for f in sorted(os.listdir(folder), key=numerical_sort):
-                if f.endswith(".png") or f.endswith(".jpg"):
-                    img = pygame.image.load(os.path.join(folder, f))
-                    img = pygame.transform.scale(img, (900, 600))  
-                    self.frames.append(img)
+        # Frames stream in on a background thread and stay cached across screen switches
+        self.frames = assets.frames(folder, (900, 600))
 
         print("Loaded challenge frames:", len(self.frames))
 
@@ -75,14 +66,15 @@ class ChallengePage:
 
     def draw(self):
         # Background video
-        if self.frames:
-            self.screen.blit(self.frames[self.current_frame], (0, 0))
+        frame = self.frames.get(self.current_frame)
+        if frame:
+            self.screen.blit(frame, (0, 0))
         else:
             self.screen.fill((255, 228, 181))  # fallback
 
         # Title with semi-transparent background
         title_text = "🌾 Quiz Mode - Select a Level"
-        title_surface = self.font.render(title_text, True, (255, 255, 255))
+        title_surface = render_text(self.font, title_text, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(450, 80))
 
         overlay = pygame.Surface((title_rect.width + 40, title_rect.height + 20), pygame.SRCALPHA)
@@ -94,7 +86,7 @@ class ChallengePage:
 
         # Back button
         pygame.draw.rect(self.screen, (200, 50, 50), self.back_button, border_radius=8)
-        back_text = self.font.render("Back", True, (255, 255, 255))
+        back_text = render_text(self.font, "Back", (255, 255, 255))
         self.screen.blit(back_text, (self.back_button.x + 15, self.back_button.y + 5))
 
         # Level buttons with semi-transparent overlay for readability
@@ -104,5 +96,5 @@ class ChallengePage:
             self.screen.blit(btn_overlay, rect.topleft)
 
             pygame.draw.rect(self.screen, (34, 139, 230), rect, 2, border_radius=8)  # border
-            text = self.font.render(f"Level {level}", True, (255, 255, 255))
+            text = render_text(self.font, f"Level {level}", (255, 255, 255))
             self.screen.blit(text, (rect.x + 100, rect.y + 10))
@@ -0,0 +1,159 @@
+# ---- Main loop: dirty-rect presenting, idle throttling and per-screen profiling ----
+import time
+from collections import defaultdict
+
+import pygame
+
+ACTIVE_FPS = 30
+IDLE_FPS = 5  # tick rate while the screen reports no changes and no input arrives
+
+# Screens may implement dirty_rects(), called once per frame after update():
+#   - None: everything may have changed; draw and present the whole window
+#   - []: nothing changed; skip draw and present (the frame counts as idle)
+#   - [rect, ...]: draw, then push only those rects to the window
+# Screens without it are treated as always animating (full redraw and flip).
+
+_MISSING = object()
+
+
+class DirtyRegions:
+    """
+    Remembers what a screen last presented. changed() takes
+    {name: (snapshot, rect)} where snapshot is any comparable summary of what
+    the region shows and rect is where it is drawn (None for "the whole
+    screen"), and returns what dirty_rects() should report.
+    """
+
+    def __init__(self):
+        self._last = None
+
+    def changed(self, regions):
+        last, self._last = self._last, {name: snap for name, (snap, _) in regions.items()}
+        if last is None:
+            return None
+        rects = []
+        for name, (snap, rect) in regions.items():
+            if last.get(name, _MISSING) != snap:
+                if rect is None:
+                    return None
+                rects.append(rect)
+        return rects
+
+
+def _percentiles(values, points=(50, 95, 99)):
+    if not values:
+        return [0.0 for _ in points]
+    ordered = sorted(values)
+    return [ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] for p in points]
+
+
+class FrameProfiler:
+    """Per-screen timings (ms) of handle_event/update/draw/present and whole frames."""
+
+    PHASES = ("handle_event", "update", "draw", "present")
+
+    def __init__(self):
+        self.phases = defaultdict(lambda: defaultdict(list))  # screen name -> phase -> [ms]
+        self.frames = defaultdict(list)  # screen name -> [frame ms]
+        self.idle = defaultdict(int)  # screen name -> frames skipped as unchanged
+        self.pixels = defaultdict(int)  # screen name -> pixels pushed to the window
+
+    def record(self, screen_obj, phase, ms):
+        self.phases[type(screen_obj).__name__][phase].append(ms)
+
+    def frame(self, screen_obj, ms, pixels, idle):
+        name = type(screen_obj).__name__
+        self.frames[name].append(ms)
+        self.pixels[name] += pixels
+        if idle:
+            self.idle[name] += 1
+
+    def report(self, window_pixels, out=print):
+        out(f"{'screen':24s} {'frames':>6s} {'idle':>5s} {'pushed':>6s}   frame ms p50/p95/p99   "
+            + "   ".join(f"{p} p50/p99" for p in self.PHASES))
+        everything = []
+        for name, frames in self.frames.items():
+            everything.extend(frames)
+            p50, p95, p99 = _percentiles(frames)
+            idle = 100.0 * self.idle[name] / len(frames)
+            pushed = 100.0 * self.pixels[name] / (window_pixels * len(frames))
+            phases = "   ".join(
+                "{:>{w}s}".format("{:.2f}/{:.2f}".format(*_percentiles(self.phases[name][p], (50, 99))), w=len(p) + 8)
+                for p in self.PHASES
+            )
+            out(f"{name:24s} {len(frames):6d} {idle:4.0f}% {pushed:5.0f}%   {p50:6.2f} {p95:6.2f} {p99:6.2f}       {phases}")
+        p50, p95, p99 = _percentiles(everything)
+        out(f"{'all screens':24s} {len(everything):6d}                {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+
+
+def run_loop(window, first_screen, fps=ACTIVE_FPS, idle_fps=IDLE_FPS, profiler=None, script=None):
+    """
+    Runs screens until the window is closed (or `script` finishes).
+    first_screen(set_screen) builds the first screen; script, if given,
+    supplies extra input each frame (see screens/benchmark.py).
+    """
+    clock = pygame.time.Clock()
+    full = window.get_rect()
+    state = {"screen": None, "repaint": True}
+
+    def set_screen(new_screen):
+        state["screen"] = new_screen
+        state["repaint"] = True
+
+    def timed(phase, fn, *args):
+        if profiler is None:
+            return fn(*args)
+        owner = state["screen"]
+        start = time.perf_counter()
+        result = fn(*args)
+        profiler.record(owner, phase, (time.perf_counter() - start) * 1000)
+        return result
+
+    set_screen(first_screen(set_screen))
+    pending = []
+    while True:
+        frame_start = time.perf_counter()
+        events, pending = pending + pygame.event.get(), []
+        if script is not None:
+            events += script.events(state["screen"])
+            if script.finished:
+                return
+
+        for event in events:
+            if event.type == pygame.QUIT:
+                return
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                state["repaint"] = True
+            # Events after a screen switch go to the new screen
+            timed("handle_event", state["screen"].handle_event, event)
+
+        timed("update", state["screen"].update)
+
+        current = state["screen"]
+        report = getattr(current, "dirty_rects", None)
+        rects = report() if report is not None else None
+        if state["repaint"]:
+            rects = None
+            state["repaint"] = False
+
+        idle = rects == [] and not events
+        pixels = 0
+        if rects != []:
+            timed("draw", current.draw)
+            if rects is None:
+                timed("present", pygame.display.flip)
+                pixels = full.w * full.h
+            else:
+                rects = [r.clip(full) for r in rects]
+                timed("present", pygame.display.update, rects)
+                pixels = sum(r.w * r.h for r in rects)
+
+        if profiler is not None:
+            profiler.frame(current, (time.perf_counter() - frame_start) * 1000, pixels, idle)
+
+        if idle:
+            # Nothing moving: sleep until input or the next slow tick, whichever comes first
+            event = pygame.event.wait(1000 // idle_fps)
+            if event.type != pygame.NOEVENT:
+                pending.append(event)
+        clock.tick(fps)
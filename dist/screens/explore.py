@@ -1,50 +1,28 @@
-import requests
-from io import BytesIO
-from PIL import Image
 import pygame
 import os
 import math
 import json
 import time
-try:
-    import moviepy.editor as mp
-except ModuleNotFoundError:
-    mp = None
-    print("⚠️ MoviePy not found. Simulation videos will use fallback animation.")
-from PIL import Image
-# Temporary compatibility patch for Pillow >=10
-if not hasattr(Image, "ANTIALIAS"):
-    Image.ANTIALIAS = Image.Resampling.LANCZOS
 
 
 
 # ---------- Backend API integration ----------
-BACKEND_URL = "https://nasa-space-app-models.onrender.com/predict"
+# Backend calls go through the shared client in screens/api_client.py, which
+# hands back Futures; screens keep them and poll from update().
+from screens.api_client import api
 
-def fetch_environment_data(lat, lon):
-    """
-    Send latitude/longitude to backend ML model to get real environment + recommendations.
-    """
-    try:
-        resp = requests.post(BACKEND_URL, json={"latitude": lat, "longitude": lon}, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            print("Received data from backend:", data)
-            return data
-        else:
-            print("Backend responded with status:", resp.status_code)
-            return SAMPLE_ENVIRONMENTS["default"]
-    except Exception as e:
-        print("Error contacting backend:", e)
-        return SAMPLE_ENVIRONMENTS["default"]
+PAN_PREFETCH_DELAY = 0.3  # seconds the map must rest before its centre is prefetched
 
 
 # ---- Tiny Web Mercator tile engine for Pygame ----
-TILE_SIZE = 256
+from screens.tiles import TileLoader, TILE_SIZE, visible_tiles
+from screens.tile_cache import default_memory_cache, default_disk_cache
+from screens.video import VideoStream
+from screens.compositor import DirtyRegions, run_loop
 
-_session = requests.Session()
-_headers = {"User-Agent": "KrishiPathaGame/1.0 (educational demo)"}
-_tile_cache = {}  # (z,x,y) -> pygame.Surface
+# Fetches tiles on worker threads into a byte-budgeted memory LRU backed by an
+# on-disk MBTiles cache; see screens/tiles.py and screens/tile_cache.py.
+_tile_loader = TileLoader(memory=default_memory_cache(), disk=default_disk_cache())
 
 def latlon_to_pixel(lat, lon, z, tile_size=TILE_SIZE):
     lat = max(min(lat, 85.05112878), -85.05112878)  # Web Mercator clamp
@@ -61,57 +39,36 @@ def pixel_to_latlon(px, py, z, tile_size=TILE_SIZE):
     lat = math.degrees(math.atan(math.sinh(n)))
     return lat, lon
 
-def _fetch_tile(z, x, y):
-    key = (z, x, y)
-    if key in _tile_cache:
-        return _tile_cache[key]
-   
-    url = f"https://tile.openstreetmap.org/{z}/{x}/{y}.png"
-    try:
-        resp = _session.get(url, headers=_headers, timeout=8)
-        if resp.status_code == 200:
-            img = Image.open(BytesIO(resp.content)).convert("RGB")
-            surf = pygame.image.fromstring(img.tobytes(), img.size, img.mode)
-            _tile_cache[key] = surf
-            return surf
-    except Exception as e:
-        print("Tile fetch error:", e)
-    return None
-
 def draw_webmap(surface, rect, center_lat, center_lon, zoom):
-    """Draws OpenStreetMap tiles covering the given rect centered at (lat, lon)."""
+    """
+    Draws OpenStreetMap tiles covering the given rect centered at (lat, lon).
+    Never waits on the network: missing tiles are queued on the background
+    loader and drawn from a scaled-up ancestor tile (or a placeholder) until
+    they arrive.
+    """
+    _tile_loader.poll()
+
     surface.set_clip(rect)
     surface.fill((180, 210, 230), rect)  # light-blue placeholder background
 
-    cx, cy = latlon_to_pixel(center_lat, center_lon, zoom)
-    left = cx - rect.w / 2
-    top = cy - rect.h / 2
-
-    start_tx = int(math.floor(left / TILE_SIZE))
-    end_tx = int(math.floor((left + rect.w) / TILE_SIZE))
-    start_ty = int(math.floor(top / TILE_SIZE))
-    end_ty = int(math.floor((top + rect.h) / TILE_SIZE))
-
-    max_tile_index = 2 ** zoom
-    for ty in range(start_ty, end_ty + 1):
-        for tx in range(start_tx, end_tx + 1):
-            # Wrap X (longitude direction)
-            x_wrap = tx % max_tile_index
-            if ty < 0 or ty >= max_tile_index:
-                continue
-
-            tile = _fetch_tile(zoom, x_wrap, ty)
-            dest_x = rect.x + int(tx * TILE_SIZE - left)
-            dest_y = rect.y + int(ty * TILE_SIZE - top)
-
-            if tile:
-                surface.blit(tile, (dest_x, dest_y))
-            else:
-                pygame.draw.rect(surface, (66, 99, 66),
-                                 pygame.Rect(dest_x, dest_y, TILE_SIZE, TILE_SIZE))
+    center_px = latlon_to_pixel(center_lat, center_lon, zoom)
+    viewport, ring, placements = visible_tiles(rect, center_px, zoom)
+    _tile_loader.request_view(zoom, viewport, ring)
+
+    for key, dest in placements:
+        tile = _tile_loader.get(*key) or _tile_loader.fallback(*key)
+        if tile:
+            surface.blit(tile, dest)
+        else:
+            pygame.draw.rect(surface, (66, 99, 66), pygame.Rect(dest[0], dest[1], TILE_SIZE, TILE_SIZE))
 
     surface.set_clip(None)
 
+def map_caption():
+    if _tile_loader.pending:
+        return "Loading map tiles..."
+    return "KrishiPatha — Explore Mode"
+
 
 pygame.font.init()
 
@@ -166,16 +123,8 @@ def recommend_livestock(env):
     return [a for _, a in recs[:2]]
 
 # ---------- Helper UI utilities ----------
-def draw_text(surface, text, font, color, pos):
-    surf = font.render(text, True, color)
-    surface.blit(surf, pos)
-    return surf.get_rect(topleft=pos)
-
-def center_text(surface, text, font, color, rect):
-    surf = font.render(text, True, color)
-    pos = (rect.x + (rect.w - surf.get_width()) // 2, rect.y + (rect.h - surf.get_height()) // 2)
-    surface.blit(surf, pos)
-    return surf.get_rect(topleft=pos)
+# Text goes through the shared cache in screens/text.py
+from screens.text import get_font, render_text, wrap_text, draw_text, center_text, draw_wrapped_text
 
 def clamp_point_to_rect(pt, rect, margin=6):
     x = max(rect.left + margin, min(int(pt[0]), rect.right - margin))
@@ -185,35 +134,17 @@ def clamp_point_to_rect(pt, rect, margin=6):
 def get_map_surface(lat, lon, zoom=13, size=(600, 400)):
     """Fetch a static map from OpenStreetMap tiles and return as Pygame Surface."""
 
-    # OSM tile math
-    import math
-    def deg2num(lat_deg, lon_deg, zoom):
-        lat_rad = math.radians(lat_deg)
-        n = 2.0 ** zoom
-        xtile = int((lon_deg + 180.0) / 360.0 * n)
-        ytile = int((1.0 - math.log(math.tan(lat_rad) + (1 / math.cos(lat_rad))) / math.pi) / 2.0 * n)
-        return (xtile, ytile)
-
     # Pick the center tile
-    xtile, ytile = deg2num(lat, lon, zoom)
-
-    # Build the URL (OpenStreetMap tile server)
-    url = f"https://a.tile.openstreetmap.fr/osmfr/{zoom}/{xtile}/{ytile}.png"
-    headers = {"User-Agent": "KrishiPathaGame/1.0 (Educational project)"}
-    #resp = requests.get(url, headers=headers, timeout=10)
-    try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        if resp.status_code == 200:
-            img = Image.open(BytesIO(resp.content)).convert("RGB")
-            # Scale tile to requested size
-            img = img.resize(size)
-            return pygame.image.fromstring(img.tobytes(), img.size, img.mode)
-        else:
-            print("Failed to load OSM tile:", resp.status_code)
-            return None
-    except Exception as e:
-        print("Error loading OSM tile:", e)
+    px, py = latlon_to_pixel(lat, lon, zoom)
+    xtile, ytile = int(px // TILE_SIZE), int(py // TILE_SIZE)
+
+    # Served from the shared tile cache when possible
+    tile = _tile_loader.fetch_blocking(zoom, xtile, ytile)
+    if tile is None:
+        print("Failed to load OSM tile:", (zoom, xtile, ytile))
         return None
+    # Scale tile to requested size
+    return pygame.transform.smoothscale(tile, size)
 
 
 # ---------- Screens ----------
@@ -222,10 +153,11 @@ class ExplorePage:
         self.screen = screen
         self.set_screen = set_screen
         self.W, self.H = screen.get_size()
-        self.title_font = pygame.font.SysFont("Arial", 36, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 20)
-        self.small_font = pygame.font.SysFont("Arial", 16)
+        self.title_font = get_font("Arial", 36, bold=True)
+        self.text_font = get_font("Arial", 20)
+        self.small_font = get_font("Arial", 16)
         self.start_btn = pygame.Rect(self.W // 2 - 120, self.H - 140, 240, 56)
+        self.view = DirtyRegions()
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -234,6 +166,9 @@ class ExplorePage:
 
     def update(self): pass
 
+    def dirty_rects(self):
+        return self.view.changed({})  # static page
+
     def draw(self):
         self.screen.fill((28, 58, 45))
         draw_text(self.screen, "Explore Mode — Real-time Farm Planner", self.title_font, (255, 255, 255), (40, 40))
@@ -254,9 +189,9 @@ class ExploreMap:
         self.screen = screen
         self.set_screen = set_screen
         self.W, self.H = screen.get_size()
-        self.title_font = pygame.font.SysFont("Arial", 28, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 18)
-        self.small_font = pygame.font.SysFont("Arial", 16)
+        self.title_font = get_font("Arial", 28, bold=True)
+        self.text_font = get_font("Arial", 18)
+        self.small_font = get_font("Arial", 16)
         self.map_rect = pygame.Rect(40, 100, self.W - 80, self.H - 220)
         self.input_active = False
         self.input_rect = pygame.Rect(60, 50, 360, 36)
@@ -271,10 +206,21 @@ class ExploreMap:
         self.is_dragging = False
         self.drag_start = None  # (mouse_x, mouse_y)
         self.drag_center_px = None  # (global_px, global_py) snapshot at start
+        self.pending_env = None  # Future for the environment of the chosen point
+        self.pending_center = None  # (lat, lon) that pending_env was requested for
+        self.last_pan = time.time()
+        self.prefetched_center = None
 
 
 
     def handle_event(self, event):
+        if self.pending_env is not None:
+            # Waiting for the chosen point's environment: further clicks, pans
+            # and zooms would move the centre away from what was requested
+            if event.type == pygame.MOUSEBUTTONUP:
+                self.is_dragging = False
+            return
+
         if event.type == pygame.MOUSEBUTTONDOWN:
             # ✅ Handle text input focus separately
             if self.input_rect.collidepoint(event.pos):
@@ -321,18 +267,9 @@ class ExploreMap:
                         # Default fallback
                         self.center_lat, self.center_lon = (25.0, 80.0)
 
-                # 🔹 Fetch live environment data from backend
-                env_data = fetch_environment_data(self.center_lat, self.center_lon)
-                self.env = env_data if isinstance(env_data, dict) else SAMPLE_ENVIRONMENTS["default"]
-
-                # ✅ Move to ExplorePlot with dynamic environment
-                self.set_screen(ExplorePlot(
-                    self.screen, self.set_screen,
-                    env=self.env,
-                    start_point=self.clicked_point,
-                    center=(self.center_lat, self.center_lon),
-                    zoom=self.zoom
-                ))
+                # 🔹 Fetch live environment data from backend; update() moves on once it arrives
+                self.pending_center = (self.center_lat, self.center_lon)
+                self.pending_env = api.environment(*self.pending_center)
 
         elif event.type == pygame.MOUSEBUTTONUP:
             self.is_dragging = False
@@ -345,6 +282,7 @@ class ExploreMap:
             new_px = start_px - dx
             new_py = start_py - dy
             self.center_lat, self.center_lon = pixel_to_latlon(new_px, new_py, self.zoom)
+            self.last_pan = time.time()
 
         elif event.type == pygame.MOUSEWHEEL:
             mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -375,6 +313,7 @@ class ExploreMap:
 
                     self.center_lat, self.center_lon = pixel_to_latlon(new_center_x, new_center_y, new_zoom)
                     self.zoom = new_zoom
+                    self.last_pan = time.time()
 
         elif event.type == pygame.KEYDOWN and self.input_active:
             if event.key == pygame.K_BACKSPACE:
@@ -400,17 +339,35 @@ class ExploreMap:
                 if len(self.input_text) < 50:
                     self.input_text += event.unicode
 
-    def update(self): pass
+    def update(self):
+        if self.pending_env is not None:
+            if self.pending_env.done():
+                env_data = self.pending_env.result()
+                self.pending_env = None
+                self.env = env_data if isinstance(env_data, dict) else SAMPLE_ENVIRONMENTS["default"]
+
+                # ✅ Move to ExplorePlot with dynamic environment
+                self.set_screen(ExplorePlot(
+                    self.screen, self.set_screen,
+                    env=self.env,
+                    start_point=self.clicked_point,
+                    center=self.pending_center,
+                    zoom=self.zoom
+                ))
+            return
+
+        # Once the map has settled, warm the cache for the cell under its centre
+        center = (self.center_lat, self.center_lon)
+        if center != self.prefetched_center and time.time() - self.last_pan > PAN_PREFETCH_DELAY:
+            self.prefetched_center = center
+            api.prefetch_environment(*center)
 
     def draw(self):
         self.screen.fill((18, 40, 26))
         draw_text(self.screen, "Select Location on Map", self.title_font, (255, 255, 255), (40, 16))
         pygame.draw.rect(self.screen, (255, 255, 255), self.input_rect, border_radius=6)
 
-        if not _tile_cache:
-            pygame.display.set_caption("Loading map tiles...")
-        else:
-            pygame.display.set_caption("KrishiPatha — Explore Mode")
+        pygame.display.set_caption(map_caption())
 
         txt = self.input_text if self.input_text else self.hint
         color = (0, 0, 0) if self.input_text else (120, 120, 120)
@@ -435,7 +392,8 @@ class ExploreMap:
             self.small_font, (210, 210, 210),
             (self.map_rect.left + 8, self.map_rect.bottom + 36))
         pygame.draw.rect(self.screen, (30, 140, 100), self.next_btn, border_radius=8)
-        center_text(self.screen, "Plot Field", self.text_font, (255, 255, 255), self.next_btn)
+        label = "Loading" + "." * (int(time.time() * 2) % 4) if self.pending_env is not None else "Plot Field"
+        center_text(self.screen, label, self.text_font, (255, 255, 255), self.next_btn)
 
 class ExplorePlot:
     def __init__(self, screen, set_screen, env=None, start_point=None, center=None, zoom=12):
@@ -443,8 +401,8 @@ class ExplorePlot:
         self.set_screen = set_screen
         self.env = env or SAMPLE_ENVIRONMENTS["default"]
         self.W, self.H = screen.get_size()
-        self.title_font = pygame.font.SysFont("Arial", 28, bold=True)
-        self.small_font = pygame.font.SysFont("Arial", 16)
+        self.title_font = get_font("Arial", 28, bold=True)
+        self.small_font = get_font("Arial", 16)
         self.map_rect = pygame.Rect(40, 100, self.W - 80, self.H - 220)
         self.points, self.is_finished = [], False
         if start_point: self.points.append(clamp_point_to_rect(start_point, self.map_rect, margin=6))
@@ -542,10 +500,7 @@ class ExplorePlot:
                 "Draw your plot: click to add vertices (Enter to finish, Backspace to undo)",
                 self.title_font, (255, 255, 255), (40, 20))
 
-        if not _tile_cache:
-            pygame.display.set_caption("Loading map tiles...")
-        else:
-            pygame.display.set_caption("KrishiPatha — Explore Mode")
+        pygame.display.set_caption(map_caption())
 
         # 🔹 Show map if available
         draw_webmap(self.screen, self.map_rect, self.center_lat, self.center_lon, self.zoom)
@@ -577,9 +532,9 @@ class ExploreStageLearning:
 
         self.polygon = [clamp_point_to_rect(p, self.map_rect, margin=6) for p in (polygon or [])]
 
-        self.title_font = pygame.font.SysFont("Arial", 26, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 18)
-        self.small_font = pygame.font.SysFont("Arial", 14)
+        self.title_font = get_font("Arial", 26, bold=True)
+        self.text_font = get_font("Arial", 18)
+        self.small_font = get_font("Arial", 14)
 
         # If backend provided real-time recommendations, use them
         if "recommended_crops" in self.env:
@@ -625,26 +580,6 @@ class ExploreStageLearning:
         self.drag_start = None
         self.drag_center_px = None
 
-    def draw_wrapped_text(self, surface, text, font, color, rect, line_height=20):
-        words = text.split(" ")
-        lines, current_line = [], ""
-        for word in words:
-            test_line = current_line + word + " "
-            if font.size(test_line)[0] <= rect.w - 20:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word + " "
-        if current_line:
-            lines.append(current_line)
-
-        y = rect.y
-        for line in lines:
-            line_surf = font.render(line, True, color)
-            surface.blit(line_surf, (rect.x + 10, y))
-            y += line_height
-        return len(lines) * line_height
-
     def handle_event(self, event):
         if self.locked:
             # ✅ If locked, only allow clicking "Next"
@@ -839,7 +774,7 @@ class ExploreStageLearning:
             center_text(self.screen, "Next →", self.text_font, (255, 255, 255), self.next_btn)
 
         if self.stage_feedback:
-            feedback_surf = self.text_font.render(self.stage_feedback, True, (255, 215, 0))
+            feedback_surf = render_text(self.text_font, self.stage_feedback, (255, 215, 0))
             feedback_x = self.map_rect.x + (self.map_rect.w - feedback_surf.get_width()) // 2
             feedback_y = self.map_rect.bottom + 10
             self.screen.blit(feedback_surf, (feedback_x, feedback_y))
@@ -856,8 +791,7 @@ class ExploreStageLearning:
 
             # measure wrapped text height
             text_rect = pygame.Rect(popup_rect.x + 10, popup_rect.y + 50, popup_rect.w - 20, 9999)
-            text_height = self.draw_wrapped_text(self.screen, explanation, self.small_font,
-                                                (220, 220, 220), text_rect, line_height=20)
+            text_height = len(wrap_text(self.small_font, explanation, text_rect.w - 20)) * 20
 
             # recalc popup rect with final height
             total_h = min(280, 100 + text_height)
@@ -873,7 +807,7 @@ class ExploreStageLearning:
 
             # draw wrapped explanation again inside popup
             text_rect = pygame.Rect(popup_rect.x + 10, popup_rect.y + 50, popup_rect.w - 20, popup_rect.h - 90)
-            self.draw_wrapped_text(self.screen, explanation, self.small_font, (220, 220, 220), text_rect, line_height=20)
+            draw_wrapped_text(self.screen, explanation, self.small_font, (220, 220, 220), text_rect, line_height=20)
 
             # buttons
             choose_btn = pygame.Rect(popup_rect.x + 20, popup_rect.bottom - 50, 120, 32)
@@ -887,7 +821,7 @@ class ExploreStageLearning:
 
         # ---------------- Feedback ----------------
         if self.stage_feedback:
-            feedback_surf = self.text_font.render(self.stage_feedback, True, (255, 215, 0))
+            feedback_surf = render_text(self.text_font, self.stage_feedback, (255, 215, 0))
             # Position the feedback centered below the map, not on the side panel
             feedback_x = self.map_rect.x + (self.map_rect.w - feedback_surf.get_width()) // 2
             feedback_y = self.map_rect.bottom + 10  # just below the map
@@ -908,9 +842,9 @@ class ExploreWaterAndProcess:
         self.zoom = zoom
         self.polygon = polygon or []
 
-        self.title_font = pygame.font.SysFont("Arial", 26, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 18)
-        self.small_font = pygame.font.SysFont("Arial", 14)
+        self.title_font = get_font("Arial", 26, bold=True)
+        self.text_font = get_font("Arial", 18)
+        self.small_font = get_font("Arial", 14)
 
         self.map_rect = pygame.Rect(40, 100, int(self.W * 0.60), self.H - 160)
         self.side_rect = pygame.Rect(self.map_rect.right + 30, 100, self.W - self.map_rect.right - 70, self.map_rect.h)
@@ -939,25 +873,6 @@ class ExploreWaterAndProcess:
             "Manual": "Traditional method. Cheap but labor-heavy and less efficient for big farms."
         }
 
-    def draw_wrapped_text(self, surface, text, font, color, rect, line_height=20):
-        words = text.split(" ")
-        lines, current_line = [], ""
-        for word in words:
-            test_line = current_line + word + " "
-            if font.size(test_line)[0] <= rect.w - 20:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word + " "
-        if current_line:
-            lines.append(current_line)
-        y = rect.y
-        for line in lines:
-            surf = font.render(line, True, color)
-            surface.blit(surf, (rect.x + 10, y))
-            y += line_height
-        return len(lines) * line_height
-
     def handle_event(self, event):
         # Map dragging and zoom
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -1065,7 +980,7 @@ class ExploreWaterAndProcess:
             draw_text(self.screen, f"{key.title()}: {val}", self.text_font, (255, 255, 255),
                       (popup_rect.x + 16, popup_rect.y + 16))
             text_rect = pygame.Rect(popup_rect.x + 10, popup_rect.y + 50, popup_rect.w - 20, popup_rect.h - 90)
-            self.draw_wrapped_text(self.screen, explanation, self.small_font, (220, 220, 220), text_rect)
+            draw_wrapped_text(self.screen, explanation, self.small_font, (220, 220, 220), text_rect)
 
             choose_btn = pygame.Rect(popup_rect.x + 20, popup_rect.bottom - 50, 120, 32)
             cancel_btn = pygame.Rect(popup_rect.right - 140, popup_rect.bottom - 50, 120, 32)
@@ -1087,62 +1002,76 @@ class ExploreSimulation:
         self.process = process
 
         self.W, self.H = screen.get_size()
-        self.title_font = pygame.font.SysFont("Arial", 28, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 18)
-        
-        video_path = os.path.join("assets", "simulation.mp4")
-        if os.path.exists(video_path):
-            self.clip = mp.VideoFileClip(video_path).resize((self.W - 400, self.H - 320))
-        else:
-            self.clip = None
+        self.title_font = get_font("Arial", 28, bold=True)
+        self.text_font = get_font("Arial", 18)
+
+        self.video_placeholder = pygame.Rect(200, 160, self.W - 400, self.H - 320)
+
+        # Frames are decoded on a background thread at placeholder size
+        video_path = os.path.join(os.path.dirname(__file__), "..", "assets", "simulation.mp4")
+        self.video = VideoStream(os.path.abspath(video_path), self.video_placeholder.size)
+
+        # The report doesn't depend on the animation, so ask for it right away
+        self.results = api.simulation_results(self.results_payload())
 
         self.start_time = time.time()
         self.sim_duration = 8  # seconds for fake loading
         self.progress = 0.0
         self.done = False
 
-        self.video_placeholder = pygame.Rect(200, 160, self.W - 400, self.H - 320)
-    
+    def results_payload(self):
+        return {
+            "date": time.strftime("%d/%m/%Y"),
+            "city": "Delhi, India",  # or you can later link it to map location
+            # Scenario fields understood by the local /analyze/simulate endpoint
+            "crop": self.crop["choice"],
+            "livestock": self.livestock["choice"],
+            "water_amount": self.process["water_amount"],
+            "irrigation": self.process["irrigation"],
+            "soil": self.env.get("soil", "loamy"),
+            "temp": self.env.get("avg_temp", 25),
+            "rainfall": self.env.get("avg_rainfall", 700),
+        }
+
+    def show_results(self, data):
+        self.video.close()
+        self.set_screen(ExploreResults(self.screen, self.set_screen, data, self.crop, self.livestock, self.process))
+
+    def report(self):
+        """The finished results Future, shaped for ExploreResults."""
+        data = self.results.result()
+        if data is None:
+            print("⚠️ Simulation backend error")
+            data = {"yield": 0, "score": 0}
+        elif "yield" not in data and "yield_value" in data:
+            data["yield"] = data["yield_value"]  # shape returned by /analyze/simulate
+        return data
+
     def handle_event(self, event):
         # Allow skipping the simulation with Enter or mouse click once complete
-        if self.done:
+        # and the report has arrived
+        if self.done and self.results.done():
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
-                self.set_screen(ExploreResults(self.screen, self.set_screen, {"yield": 3000, "score": 80}, self.crop, self.livestock, self.process))
+                self.show_results(self.report())
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.set_screen(ExploreResults(self.screen, self.set_screen, {"yield": 3000, "score": 80}, self.crop, self.livestock, self.process))
+                self.show_results(self.report())
 
 
     def update(self):
         elapsed = time.time() - self.start_time
         self.progress = min(1.0, elapsed / self.sim_duration)
-        if self.progress >= 1.0 and not self.done:
+        if self.progress >= 1.0:
             self.done = True
-            time.sleep(0.5)
-            # send to backend for results
-            try:
-                resp = requests.post(
-                    "https://nasa-space-app-models.onrender.com/predict",
-                    json={
-                        "date": time.strftime("%d/%m/%Y"),
-                        "city": "Delhi, India"  # or you can later link it to map location
-                    },
-                    timeout=15
-                )
-                data = resp.json() if resp.status_code == 200 else {"yield": 0, "score": 0}
-            except Exception as e:
-                print("⚠️ Simulation backend error:", e)
-                data = {"yield": 0, "score": 0}
-
-            self.set_screen(ExploreResults(self.screen, self.set_screen, data, self.crop, self.livestock, self.process))
+            # Never wait on the network here; keep animating until the report arrives
+            if self.results.done():
+                self.show_results(self.report())
 
     def draw(self):
         self.screen.fill((15, 35, 25))
         draw_text(self.screen, "Simulating Farming Process...", self.title_font, (255, 255, 255), (40, 30))
 
-        if self.clip:
-            frame = self.clip.get_frame(time.time() - self.start_time)
-            frame_surface = pygame.image.frombuffer(frame.tobytes(), frame.shape[1::-1], "RGB")
-            frame_surface = pygame.transform.scale(frame_surface, (self.video_placeholder.w, self.video_placeholder.h))
+        frame_surface = self.video.frame()
+        if frame_surface:
             self.screen.blit(frame_surface, self.video_placeholder)
         else:
             pygame.draw.rect(self.screen, (50, 80, 50), self.video_placeholder, border_radius=12)
@@ -1153,7 +1082,13 @@ class ExploreSimulation:
         pygame.draw.rect(self.screen, (80, 120, 80), bar_rect, border_radius=6)
         inner_width = int(bar_rect.w * self.progress)
         pygame.draw.rect(self.screen, (60, 200, 90), (bar_rect.x, bar_rect.y, inner_width, bar_rect.h), border_radius=6)
-        percent_text = f"{int(self.progress * 100)}%"
+        if self.done:
+            # Still waiting on the backend: sweep a highlight across the full bar
+            sweep_x = bar_rect.x + int((time.time() * 300) % bar_rect.w)
+            pygame.draw.rect(self.screen, (140, 240, 160), (sweep_x, bar_rect.y, min(60, bar_rect.right - sweep_x), bar_rect.h))
+            percent_text = "Fetching results" + "." * (int(time.time() * 2) % 4)
+        else:
+            percent_text = f"{int(self.progress * 100)}%"
         center_text(self.screen, percent_text, self.text_font, (255, 255, 255), bar_rect)
 
 
@@ -1168,12 +1103,13 @@ class ExploreResults:
         self.process = process
 
         self.W, self.H = screen.get_size()
-        self.title_font = pygame.font.SysFont("Arial", 28, bold=True)
-        self.text_font = pygame.font.SysFont("Arial", 18)
-        self.small_font = pygame.font.SysFont("Arial", 16)
+        self.title_font = get_font("Arial", 28, bold=True)
+        self.text_font = get_font("Arial", 18)
+        self.small_font = get_font("Arial", 16)
 
         # ✅ single home button
         self.home_btn = pygame.Rect(self.W // 2 - 100, self.H - 80, 200, 50)
+        self.view = DirtyRegions()
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -1185,6 +1121,9 @@ class ExploreResults:
     def update(self, dt=1/60):
         pass
 
+    def dirty_rects(self):
+        return self.view.changed({})  # static report
+
     def draw(self):
         self.screen.fill((18, 45, 28))
         draw_text(self.screen, "Farming Results & Sustainability Report", self.title_font, (255, 255, 255), (40, 30))
@@ -1216,31 +1155,8 @@ class ExploreResults:
 if __name__ == "__main__":
     pygame.init()
     screen = pygame.display.set_mode((1200, 720))
-    clock = pygame.time.Clock()
-
-    current_screen = None
-
-    def set_screen(new_screen):
-        global current_screen   # ✅ use global instead of nonlocal
-        current_screen = new_screen
 
     # Start from the ExplorePage
-    set_screen(ExplorePage(screen, set_screen))
-
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            if current_screen:
-                current_screen.handle_event(event)
-
-        if current_screen:
-            current_screen.update()
-            current_screen.draw()
-
-        pygame.display.flip()
-        clock.tick(60)
+    run_loop(screen, lambda set_screen: ExplorePage(screen, set_screen), fps=60)
 
     pygame.quit()
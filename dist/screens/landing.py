@@ -1,6 +1,8 @@
-import pygame, os, re
+import pygame, os
 from screens.explore import ExplorePage
 from screens.challenge import ChallengePage
+from screens.assets import assets
+from screens.text import get_font, render_text
 
 class LandingPage:
     def __init__(self, screen, set_screen_callback):
@@ -12,19 +14,8 @@ class LandingPage:
         folder = os.path.join(base_path, "..", "assets", "background", "landing_bg")
         folder = os.path.abspath(folder)
 
-        # Sort frames numerically
-        def numerical_sort(value):
-            numbers = re.findall(r'\d+', value)
-            return int(numbers[0]) if numbers else -1
-
-        # Load frames
-        self.frames = []
-        if os.path.exists(folder):
-            for f in sorted(os.listdir(folder), key=numerical_sort):
-                if f.endswith(".png") or f.endswith(".jpg"):
-                    img = pygame.image.load(os.path.join(folder, f))
-                    img = pygame.transform.scale(img, (900, 600))  
-                    self.frames.append(img)
+        # Frames stream in on a background thread and stay cached across screen switches
+        self.frames = assets.frames(folder, (900, 600))
 
         print("Loaded frames:", len(self.frames))
 
@@ -33,8 +24,10 @@ class LandingPage:
         self.counter = 0
 
         # Fonts
-        self.font = pygame.font.SysFont("Arial", 36, bold=True)
-        self.title_font = pygame.font.SysFont("Arial", 60, bold=True)
+        self.font = get_font("Arial", 36, bold=True)
+        self.title_font = get_font("Arial", 60, bold=True)
+        # Own copy: the fade-in changes its alpha, so it can't be the shared cached surface
+        self.title = self.title_font.render("KrishiPatha", True, (255, 255, 255))
 
         # Buttons
         self.learn_button = pygame.Rect(350, 250, 200, 60)
@@ -65,8 +58,9 @@ class LandingPage:
 
     def draw(self):
         # Background
-        if self.frames:
-            self.screen.blit(self.frames[self.current_frame], (0, 0))
+        frame = self.frames.get(self.current_frame)
+        if frame:
+            self.screen.blit(frame, (0, 0))
         else:
             self.screen.fill((200, 255, 200))
 
@@ -76,7 +70,7 @@ class LandingPage:
         self.screen.blit(overlay, (0, 0))
 
         # Center title
-        title = self.title_font.render("KrishiPatha", True, (255, 255, 255))
+        title = self.title
         title.set_alpha(self.alpha)
         title_rect = title.get_rect(center=(450, 150))   # center horizontally
         self.screen.blit(title, title_rect)
@@ -87,13 +81,13 @@ class LandingPage:
         # Learn button
         learn_color = (34, 197, 94) if not self.learn_button.collidepoint(mouse_pos) else (20, 150, 70)
         pygame.draw.rect(self.screen, learn_color, self.learn_button, border_radius=15)
-        learn_text = self.font.render("Explore", True, (255, 255, 255))
+        learn_text = render_text(self.font, "Explore", (255, 255, 255))
         learn_rect = learn_text.get_rect(center=self.learn_button.center)
         self.screen.blit(learn_text, learn_rect)
 
         # Challenge button
         challenge_color = (234, 179, 8) if not self.challenge_button.collidepoint(mouse_pos) else (200, 140, 0)
         pygame.draw.rect(self.screen, challenge_color, self.challenge_button, border_radius=15)
-        challenge_text = self.font.render("Quiz", True, (0, 0, 0))
+        challenge_text = render_text(self.font, "Quiz", (0, 0, 0))
         challenge_rect = challenge_text.get_rect(center=self.challenge_button.center)
         self.screen.blit(challenge_text, challenge_rect)
@@ -1,6 +1,9 @@
 import pygame
 import os
 import webbrowser
+from screens.assets import assets
+from screens.compositor import DirtyRegions
+from screens.text import get_font, render_text, draw_text
 
 class Level1:
     def __init__(self, screen, set_screen_callback):
@@ -19,8 +22,8 @@ class Level1:
         self.BUTTON_BG = (0, 0, 0, 100)  # translucent black
 
         # Fonts
-        self.font = pygame.font.Font(None, 34)
-        self.big_font = pygame.font.Font(None, 72)
+        self.font = get_font(None, 34)
+        self.big_font = get_font(None, 72)
 
         # States
         self.STATE_CROP_SELECT = "crop_select"
@@ -40,15 +43,15 @@ class Level1:
         self.feedback_time = 0
         self.quiz_countdown_start = 0
         self.quiz_countdown_length = 3
+        self.view = DirtyRegions()
 
         # Asset loading
         base = os.path.dirname(__file__)
         self.assets = os.path.abspath(os.path.join(base, "..", "..", "extras", "level1"))
 
-        def load_image(name, size):
+        def load_image(name, size, alpha=False):
             try:
-                img = pygame.image.load(os.path.join(self.assets, name))
-                return pygame.transform.scale(img, size)
+                return assets.image(os.path.join(self.assets, name), size, alpha=alpha)
             except Exception as e:
                 print(f"Failed to load {name}: {e}")
                 surf = pygame.Surface(size)
@@ -57,13 +60,13 @@ class Level1:
 
         self.farm_bg = load_image("farm_bg.jpg", (self.W, self.H))
         self.quiz_bg = load_image("quiz_bg.jpg", (self.W, self.H))
-        self.wheat_img = load_image("wheat.png", (120, 120))
-        self.rice_img = load_image("rice.png", (120, 120))
-        self.cotton_img = load_image("cotton.png", (120, 120))
-        self.harvest_img = load_image("sack.png", (150, 150))
-        self.canal_img = load_image("canal.png", (120, 120))
-        self.sprinkler_img = load_image("sprinkler.png", (120, 120))
-        self.drip_img = load_image("drip.png", (120, 120))
+        self.wheat_img = load_image("wheat.png", (120, 120), alpha=True)
+        self.rice_img = load_image("rice.png", (120, 120), alpha=True)
+        self.cotton_img = load_image("cotton.png", (120, 120), alpha=True)
+        self.harvest_img = load_image("sack.png", (150, 150), alpha=True)
+        self.canal_img = load_image("canal.png", (120, 120), alpha=True)
+        self.sprinkler_img = load_image("sprinkler.png", (120, 120), alpha=True)
+        self.drip_img = load_image("drip.png", (120, 120), alpha=True)
 
         # Button Rects
         self.back_button_rect = pygame.Rect(20, 20, 200, 40)
@@ -83,17 +86,14 @@ class Level1:
         ]
 
     def draw_text(self, text, x, y, color=None, font=None):
-        font = font or self.font
-        color = color or self.BLACK
-        rendered = font.render(text, True, color)
-        self.screen.blit(rendered, (x, y))
+        draw_text(self.screen, text, font or self.font, color or self.BLACK, (x, y))
 
     def draw_button(self, text, rect, color):
         s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
         s.fill(self.BUTTON_BG)
         self.screen.blit(s, rect.topleft)
         pygame.draw.rect(self.screen, self.DARK_BLUE, rect, 2, border_radius=8)
-        txt_surf = self.font.render(text, True, pygame.Color('white'))
+        txt_surf = render_text(self.font, text, pygame.Color('white'))
         txt_rect = txt_surf.get_rect(center=rect.center)
         self.screen.blit(txt_surf, txt_rect)
 
@@ -191,6 +191,18 @@ class Level1:
                 if self.current_question >= len(self.questions):
                     self.state = self.STATE_RESULT
 
+    def dirty_rects(self):
+        # Pages are static; only the countdown number and the feedback line change in place
+        remaining = None
+        if self.state == self.STATE_QUIZ_COUNTDOWN:
+            elapsed = (pygame.time.get_ticks() - self.quiz_countdown_start) / 1000.0
+            remaining = max(0, int(self.quiz_countdown_length - elapsed))
+        return self.view.changed({
+            "page": ((self.state, self.selected_crop, self.selected_irrigation, self.current_question, self.score), None),
+            "countdown": (remaining, pygame.Rect(0, self.H // 2 - 60, self.W, 80)),
+            "feedback": (self.feedback_text, pygame.Rect(0, 510, self.W, 50)),
+        })
+
     def draw(self):
         if self.state in (self.STATE_QUIZ_COUNTDOWN, self.STATE_QUIZ, self.STATE_RESULT):
             self.screen.blit(self.quiz_bg, (0, 0))
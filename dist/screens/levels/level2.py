@@ -1,6 +1,9 @@
 import pygame
 import os
 import webbrowser
+from screens.assets import assets
+from screens.compositor import DirtyRegions
+from screens.text import get_font, render_text, draw_text, draw_wrapped_text
 
 class Level2:
     def __init__(self, screen, set_screen_callback):
@@ -17,8 +20,8 @@ class Level2:
         self.GRAY = (200, 200, 200)
         self.DARK_BLUE = (10, 30, 80)
         self.BUTTON_BG = (0, 0, 0, 110)
-        self.font = pygame.font.Font(None, 34)
-        self.big_font = pygame.font.Font(None, 72)
+        self.font = get_font(None, 34)
+        self.big_font = get_font(None, 72)
 
         # States
         self.STATE_QUIZ_COUNTDOWN = "quiz_countdown"
@@ -33,6 +36,7 @@ class Level2:
         self.feedback_time = 0
         self.quiz_countdown_start = 0
         self.quiz_countdown_length = 3
+        self.view = DirtyRegions()
 
         # Paths and quiz background, with debug print
         base = os.path.dirname(__file__)
@@ -40,8 +44,7 @@ class Level2:
         quiz_bg_path = os.path.join(self.assets, "quiz_bg2.png")
         print("Quiz background path:", quiz_bg_path)
         try:
-            self.quiz_bg = pygame.image.load(quiz_bg_path)
-            self.quiz_bg = pygame.transform.scale(self.quiz_bg, (self.W, self.H))
+            self.quiz_bg = assets.image(quiz_bg_path, (self.W, self.H))
         except Exception as e:
             print("Failed to load quiz_bg.png:", e)
             self.quiz_bg = None
@@ -102,31 +105,11 @@ class Level2:
         ]
 
     def draw_text(self, text, x, y, color=None, font=None):
-        font = font or self.font
-        color = color or self.BLACK
-        rendered = font.render(text, True, color)
-        self.screen.blit(rendered, (x, y))
+        draw_text(self.screen, text, font or self.font, color or self.BLACK, (x, y))
 
     def draw_wrapped_text(self, text, rect, color=None):
-        color = color or self.BLACK
-        words = text.split(' ')
-        space_width, space_height = self.font.size(' ')
-        max_width = rect.width - 20  # padding
-        x, y = rect.topleft
-        line = ''
-        for word in words:
-            test_line = line + word + ' '
-            test_width, _ = self.font.size(test_line)
-            if test_width <= max_width:
-                line = test_line
-            else:
-                render_line = self.font.render(line, True, color)
-                self.screen.blit(render_line, (x + 10, y))
-                y += space_height + 5
-                line = word + ' '
-        if line:
-            render_line = self.font.render(line, True, color)
-            self.screen.blit(render_line, (x + 10, y))
+        draw_wrapped_text(self.screen, text, self.font, color or self.BLACK, rect,
+                          line_height=self.font.get_height() + 5)
 
     def draw_button(self, text, rect, color):
         s = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
@@ -200,6 +183,18 @@ class Level2:
                 if self.current_question >= len(self.questions):
                     self.state = self.STATE_RESULT
 
+    def dirty_rects(self):
+        # Pages are static; only the countdown number and the feedback line change in place
+        remaining = None
+        if self.state == self.STATE_QUIZ_COUNTDOWN:
+            elapsed = (pygame.time.get_ticks() - self.quiz_countdown_start) / 1000.0
+            remaining = max(0, int(self.quiz_countdown_length - elapsed))
+        return self.view.changed({
+            "page": ((self.state, self.current_question, self.score), None),
+            "countdown": (remaining, pygame.Rect(0, self.H // 2 - 50, self.W, 80)),
+            "feedback": (self.feedback_text, pygame.Rect(0, 540, self.W, 50)),
+        })
+
     def draw(self):
         if self.quiz_bg:
             self.screen.blit(self.quiz_bg, (0, 0))
@@ -0,0 +1,125 @@
+# ---- Shared text rendering: font registry, rendered text cache, wrap layouts ----
+import pygame
+from collections import OrderedDict
+
+MAX_TEXT_SURFACES = 1024  # rendered strings kept; labels and paragraphs rarely change between frames
+MAX_LAYOUTS = 256  # wrapped paragraphs kept
+
+
+class TextCache:
+    """
+    Screens redraw the same labels every frame. This keeps one Font object
+    per (name, size, bold, italic), the rendered Surface per (font, text,
+    color, antialias) in an LRU, and the line breaks of wrapped paragraphs
+    per (text, font, width), so a steady frame renders and measures nothing.
+    """
+
+    def __init__(self, max_surfaces=MAX_TEXT_SURFACES, max_layouts=MAX_LAYOUTS):
+        self.max_surfaces = max_surfaces
+        self.max_layouts = max_layouts
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+        self._layouts = OrderedDict()
+
+        # Benchmark counters
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, name, size, bold=False, italic=False):
+        """SysFont (or pygame's default font when name is None), created once per process."""
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self._fonts[key] = font
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        """font.render(text, antialias, color), cached. Don't draw on the returned surface."""
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        self._surfaces[key] = surf
+        while len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def wrap(self, font, text, width):
+        """Greedy word wrap of `text` into lines no wider than `width` pixels (as a tuple)."""
+        key = (text, font, width)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+
+        lines, current = [], ""
+        for word in text.split(" "):
+            test_line = current + word + " "
+            if font.size(test_line)[0] <= width or not current:
+                current = test_line
+            else:
+                lines.append(current)
+                current = word + " "
+        if current:
+            lines.append(current)
+        lines = tuple(lines)
+
+        self._layouts[key] = lines
+        while len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def stats(self):
+        return {"fonts": len(self._fonts), "surfaces": len(self._surfaces), "layouts": len(self._layouts),
+                "hits": self.hits, "misses": self.misses}
+
+
+text_cache = TextCache()
+
+
+def get_font(name, size, bold=False, italic=False):
+    return text_cache.font(name, size, bold, italic)
+
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+
+def wrap_text(font, text, width):
+    return text_cache.wrap(font, text, width)
+
+
+def draw_text(surface, text, font, color, pos):
+    surf = text_cache.render(font, text, color)
+    surface.blit(surf, pos)
+    return surf.get_rect(topleft=pos)
+
+
+def center_text(surface, text, font, color, rect):
+    surf = text_cache.render(font, text, color)
+    pos = (rect.x + (rect.w - surf.get_width()) // 2, rect.y + (rect.h - surf.get_height()) // 2)
+    surface.blit(surf, pos)
+    return surf.get_rect(topleft=pos)
+
+
+def draw_wrapped_text(surface, text, font, color, rect, line_height=20, padding=10):
+    """Draws `text` wrapped to rect's width (less padding on both sides); returns the height used."""
+    lines = text_cache.wrap(font, text, rect.w - 2 * padding)
+    y = rect.y
+    for line in lines:
+        surface.blit(text_cache.render(font, line, color), (rect.x + padding, y))
+        y += line_height
+    return len(lines) * line_height
@@ -0,0 +1,212 @@
+# ---- Tiered tile cache: in-memory LRU of surfaces + MBTiles-style SQLite on disk ----
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+
+_default_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "cache", "tiles.mbtiles"))
+
+# Set KRISHIPATHA_TILE_CACHE to an empty string to turn the disk cache off.
+TILE_CACHE_PATH = os.environ.get("KRISHIPATHA_TILE_CACHE", _default_path)
+TILE_MEMORY_MB = float(os.environ.get("KRISHIPATHA_TILE_MEMORY_MB", "64"))
+TILE_DISK_MB = float(os.environ.get("KRISHIPATHA_TILE_DISK_MB", "256"))
+TILE_MAX_AGE_DAYS = float(os.environ.get("KRISHIPATHA_TILE_MAX_AGE_DAYS", "7"))
+
+
+class MemoryTileCache:
+    """
+    LRU of decoded pygame surfaces, bounded by the bytes their pixels use.
+    hits/misses count tiles the loader was asked to resolve (see count()),
+    not the per-frame lookups of the render path.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._tiles = OrderedDict()  # (z,x,y) -> pygame.Surface
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Lookup that refreshes recency without counting (called per tile per frame)."""
+        surf = self._tiles.get(key)
+        if surf is not None:
+            self._tiles.move_to_end(key)
+        return surf
+
+    def count(self, keys):
+        """Records a hit or miss for each tile the loader has just been asked for."""
+        for key in keys:
+            if key in self._tiles:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def peek(self, key):
+        """Lookup that neither counts nor refreshes recency (used for fallbacks)."""
+        return self._tiles.get(key)
+
+    def put(self, key, surf):
+        old = self._tiles.pop(key, None)
+        if old is not None:
+            self.used_bytes -= _surface_bytes(old)
+        self._tiles[key] = surf
+        self.used_bytes += _surface_bytes(surf)
+        while self.used_bytes > self.budget_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self.used_bytes -= _surface_bytes(evicted)
+            self.evictions += 1
+
+    def __contains__(self, key):
+        return key in self._tiles
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def stats(self):
+        return {
+            "tiles": len(self._tiles),
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class DiskTileCache:
+    """
+    Encoded tiles in an MBTiles-style SQLite file (TMS row order). Tiles older
+    than max_age are treated as misses, and the least recently used tiles are
+    deleted once the stored PNG bytes exceed max_bytes. Safe to share between
+    the tile loader's worker threads.
+    """
+
+    def __init__(self, path, max_bytes, max_age):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                tile_data BLOB, size INTEGER, fetched_at REAL, accessed_at REAL,
+                PRIMARY KEY (zoom_level, tile_column, tile_row)
+            );
+            CREATE INDEX IF NOT EXISTS tiles_accessed ON tiles (accessed_at);
+        """)
+        self._db.executemany(
+            "INSERT OR IGNORE INTO metadata (name, value) VALUES (?, ?)",
+            [("name", "KrishiPatha tile cache"), ("format", "png")],
+        )
+        self._db.commit()
+        self.used_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _row(key):
+        z, x, y = key
+        return z, x, (2 ** z - 1) - y  # MBTiles stores rows bottom-up
+
+    def get(self, key):
+        row = self._row(key)
+        now = time.time()
+        with self._lock:
+            found = self._db.execute(
+                "SELECT tile_data, fetched_at FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                row,
+            ).fetchone()
+            if found is None:
+                self.misses += 1
+                return None
+            data, fetched_at = found
+            if now - fetched_at > self.max_age:
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE tiles SET accessed_at=? WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (now,) + row,
+            )
+            self._db.commit()
+            self.hits += 1
+            return bytes(data)
+
+    def put(self, key, data):
+        row = self._row(key)
+        now = time.time()
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", row
+            ).fetchone()
+            if old:
+                self.used_bytes -= old[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                row + (sqlite3.Binary(data), len(data), now, now),
+            )
+            self.used_bytes += len(data)
+            if self.used_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+            self._db.commit()
+
+    def _evict(self, target_bytes):
+        # Expired tiles go first, then the least recently used ones.
+        cutoff = time.time() - self.max_age
+        count, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tiles WHERE fetched_at < ?", (cutoff,)
+        ).fetchone()
+        if count:
+            self._db.execute("DELETE FROM tiles WHERE fetched_at < ?", (cutoff,))
+            self.used_bytes -= size
+            self.evictions += count
+        oldest = self._db.execute(
+            "SELECT zoom_level, tile_column, tile_row, size FROM tiles ORDER BY accessed_at"
+        ).fetchall()
+        doomed = []
+        for z, x, r, size in oldest:
+            if self.used_bytes <= target_bytes:
+                break
+            doomed.append((z, x, r))
+            self.used_bytes -= size
+            self.evictions += 1
+        self._db.executemany("DELETE FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", doomed)
+
+    def stats(self):
+        return {
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
+
+
+def _surface_bytes(surf):
+    return surf.get_pitch() * surf.get_height()
+
+
+def default_memory_cache():
+    return MemoryTileCache(int(TILE_MEMORY_MB * 1024 * 1024))
+
+
+def default_disk_cache():
+    if not TILE_CACHE_PATH:
+        return None
+    try:
+        return DiskTileCache(TILE_CACHE_PATH, int(TILE_DISK_MB * 1024 * 1024), TILE_MAX_AGE_DAYS * 86400)
+    except (sqlite3.Error, OSError) as e:
+        print("Tile disk cache disabled:", e)
+        return None
@@ -0,0 +1,277 @@
+# ---- Background tile loader for the Explore map ----
+import os
+import math
+import time
+import queue
+import threading
+from io import BytesIO
+
+import requests
+import pygame
+from PIL import Image
+
+from screens.tile_cache import default_memory_cache
+
+TILE_SIZE = 256
+
+# Override with e.g. KRISHIPATHA_TILE_URL=http://127.0.0.1:8080/{z}/{x}/{y}.png
+# to benchmark against a local stand-in tile server.
+TILE_URL = os.environ.get("KRISHIPATHA_TILE_URL", "https://tile.openstreetmap.org/{z}/{x}/{y}.png")
+TILE_WORKERS = int(os.environ.get("KRISHIPATHA_TILE_WORKERS", "4"))
+
+PRIORITY_VIEWPORT = 0
+PRIORITY_PREFETCH = 1
+RETRY_FAILED_AFTER = 30  # seconds before a failed tile is requested again
+
+_headers = {"User-Agent": "KrishiPathaGame/1.0 (educational demo)"}
+
+
+class TileLoader:
+    """
+    Fetches map tiles on a pool of worker threads so draw() never blocks.
+    Viewport tiles are queued ahead of the prefetch ring, duplicate requests
+    for the same tile are merged, and tiles that scrolled out of view before
+    a worker picked them up are dropped.
+
+    Decoded tiles live in `memory` (a MemoryTileCache); if a DiskTileCache is
+    given, workers read PNGs from it before going to the network and store
+    every download in it.
+    """
+
+    def __init__(self, url=TILE_URL, workers=TILE_WORKERS, timeout=8, memory=None, disk=None):
+        self.url = url
+        self.timeout = timeout
+        self.memory = memory if memory is not None else default_memory_cache()
+        self.disk = disk
+        self.failed = {}  # (z,x,y) -> time of the failed attempt
+
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._queue = queue.PriorityQueue()
+        self._done = queue.Queue()  # (key, (size, rgb_bytes) or None) from workers
+        self._lock = threading.Lock()
+        self._in_flight = {}  # key -> (priority, seq) of the live queue entry, until poll() stores it
+        self._active = set()  # keys a worker has taken, until poll() stores or fails them
+        self._wanted = set()
+        self._seq = 0
+
+        # Benchmark counters
+        self.requested = 0
+        self.merged = 0
+        self.skipped = 0
+        self.fetched = 0
+        self.errors = 0
+        self._viewport = None
+        self._viewport_started = None
+        self.last_viewport_ms = None  # time-to-full-viewport of the last view
+
+        self._workers = []
+        for i in range(workers):
+            t = threading.Thread(target=self._worker, name=f"tile-loader-{i}", daemon=True)
+            t.start()
+            self._workers.append(t)
+
+    # ---------- render thread ----------
+    def get(self, z, x, y):
+        """Returns the tile surface if it has arrived, otherwise None (never blocks)."""
+        return self.memory.get((z, x, y))
+
+    def request(self, keys, priority):
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                if key in self.memory:
+                    continue
+                if now - self.failed.get(key, -RETRY_FAILED_AFTER) < RETRY_FAILED_AFTER:
+                    continue
+                queued = self._in_flight.get(key)
+                if key in self._active or (queued is not None and queued[0] <= priority):
+                    continue
+                # New request, or a prefetch tile that is now in the viewport
+                self._seq += 1
+                self._in_flight[key] = (priority, self._seq)
+                self._queue.put((priority, self._seq, key))
+                self.requested += 1
+
+    def request_view(self, zoom, viewport, ring):
+        """
+        Queues the visible tiles first and a ring of neighbours behind them.
+        Tiles that are neither visible nor in the ring are no longer wanted.
+        """
+        viewport = list(viewport)
+        ring = [k for k in ring if k not in viewport]
+        wanted = set(viewport) | set(ring)
+        with self._lock:
+            arrived = wanted - self._wanted
+            self._wanted = wanted
+            # Tiles that come into view while still queued or downloading join that request
+            self.merged += sum(1 for key in arrived if key in self._in_flight)
+        self.memory.count(arrived)
+
+        view_key = (zoom, tuple(viewport))
+        if view_key != self._viewport:
+            self._viewport = view_key
+            self._viewport_started = time.perf_counter()
+
+        self.request(viewport, PRIORITY_VIEWPORT)
+        self.request(ring, PRIORITY_PREFETCH)
+
+    def poll(self):
+        """Turns finished downloads into surfaces. Call once per frame on the render thread."""
+        while True:
+            try:
+                key, result = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                self.failed[key] = time.time()
+            else:
+                self.failed.pop(key, None)
+                self.memory.put(key, _to_surface(result))
+            # Only now can request() see the tile as cached or failed
+            with self._lock:
+                self._active.discard(key)
+                self._in_flight.pop(key, None)
+
+        if self._viewport_started is not None and self._viewport:
+            if all(k in self.memory or k in self.failed for k in self._viewport[1]):
+                self.last_viewport_ms = (time.perf_counter() - self._viewport_started) * 1000
+                self._viewport_started = None
+
+    @property
+    def pending(self):
+        return len(self._in_flight)
+
+    def fallback(self, z, x, y, max_levels=4):
+        """Scales up the closest cached ancestor tile to stand in for (z, x, y)."""
+        for up in range(1, min(max_levels, z) + 1):
+            parent = self.memory.peek((z - up, x >> up, y >> up))
+            if parent is None:
+                continue
+            part = TILE_SIZE >> up
+            mask = (1 << up) - 1
+            src = pygame.Rect((x & mask) * part, (y & mask) * part, part, part)
+            return pygame.transform.scale(parent.subsurface(src), (TILE_SIZE, TILE_SIZE))
+        return None
+
+    def fetch_blocking(self, z, x, y):
+        """
+        Returns the tile surface, loading it on the calling thread if needed.
+        Only for one-off static maps; the map screens use request_view().
+        """
+        key = (z, x, y)
+        self.memory.count([key])
+        surf = self.memory.get(key)
+        if surf is None:
+            result = self._load(key)
+            if result is None:
+                return None
+            surf = _to_surface(result)
+            self.memory.put(key, surf)
+        return surf
+
+    def stats(self):
+        return {
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk else None,
+            "pending": self.pending,
+            "requested": self.requested,
+            "merged": self.merged,
+            "skipped": self.skipped,
+            "fetched": self.fetched,
+            "errors": self.errors,
+            "last_viewport_ms": self.last_viewport_ms,
+        }
+
+    # ---------- worker threads ----------
+    def _worker(self):
+        while True:
+            priority, seq, key = self._queue.get()
+            with self._lock:
+                if self._in_flight.get(key) != (priority, seq) or key in self._active:
+                    # Superseded by a higher-priority copy of this request
+                    continue
+                if key not in self._wanted:
+                    # Scrolled out of view before we got to it
+                    del self._in_flight[key]
+                    self.skipped += 1
+                    continue
+                self._active.add(key)
+
+            result = self._load(key)
+            with self._lock:
+                if result is None:
+                    self.errors += 1
+                else:
+                    self.fetched += 1
+            self._done.put((key, result))
+
+    def _load(self, key):
+        """Disk cache, then network. Returns ((w, h), rgb_bytes) or None."""
+        data = self.disk.get(key) if self.disk else None
+        if data is None:
+            data = self._download(key)
+            if data is None:
+                return None
+            if self.disk:
+                self.disk.put(key, data)
+        try:
+            img = Image.open(BytesIO(data)).convert("RGB")
+        except Exception as e:
+            print("Tile decode error:", e)
+            return None
+        return img.size, img.tobytes()
+
+    def _download(self, key):
+        z, x, y = key
+        url = self.url.format(z=z, x=x, y=y)
+        try:
+            resp = self._session.get(url, headers=_headers, timeout=self.timeout)
+            if resp.status_code == 200:
+                return resp.content
+            print("Tile fetch status:", resp.status_code, url)
+        except Exception as e:
+            print("Tile fetch error:", e)
+        return None
+
+
+def _to_surface(result):
+    size, data = result
+    surf = pygame.image.fromstring(data, size, "RGB")
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()  # display format blits without per-pixel conversion
+    return surf
+
+
+def visible_tiles(rect, center_px, zoom, ring=1):
+    """
+    Returns (viewport, ring_tiles, placements) for a map rect centred on the
+    global pixel center_px. placements is a list of ((z,x,y), (dest_x, dest_y)).
+    """
+    cx, cy = center_px
+    left = cx - rect.w / 2
+    top = cy - rect.h / 2
+
+    start_tx = int(math.floor(left / TILE_SIZE))
+    end_tx = int(math.floor((left + rect.w) / TILE_SIZE))
+    start_ty = int(math.floor(top / TILE_SIZE))
+    end_ty = int(math.floor((top + rect.h) / TILE_SIZE))
+
+    max_tile_index = 2 ** zoom
+    viewport, placements, ring_tiles = [], [], []
+    for ty in range(start_ty - ring, end_ty + ring + 1):
+        if ty < 0 or ty >= max_tile_index:
+            continue
+        for tx in range(start_tx - ring, end_tx + ring + 1):
+            # Wrap X (longitude direction)
+            key = (zoom, tx % max_tile_index, ty)
+            if start_tx <= tx <= end_tx and start_ty <= ty <= end_ty:
+                viewport.append(key)
+                dest = (rect.x + int(tx * TILE_SIZE - left), rect.y + int(ty * TILE_SIZE - top))
+                placements.append((key, dest))
+            else:
+                ring_tiles.append(key)
+    return viewport, ring_tiles, placements
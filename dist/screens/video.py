@@ -0,0 +1,142 @@
+# ---- Background video decoding for the simulation screen ----
+import os
+import time
+import threading
+from collections import deque
+
+import numpy as np
+import pygame
+from PIL import Image
+
+# Temporary compatibility patch for Pillow >=10 (MoviePy 1.x resize uses it)
+if not hasattr(Image, "ANTIALIAS"):
+    Image.ANTIALIAS = Image.Resampling.LANCZOS
+
+try:
+    import moviepy.editor as mp
+except ModuleNotFoundError:
+    mp = None
+    print("⚠️ MoviePy not found. Simulation videos will use fallback animation.")
+
+
+class VideoStream:
+    """
+    Decodes a clip on a background thread into a small ring buffer of
+    surfaces that are already at display size. Surfaces wrap MoviePy's
+    frame arrays directly (no tobytes() copy, no rescale on the render
+    thread). When decoding falls behind the wall clock, late frames are
+    skipped instead of slowing playback down.
+
+    If MoviePy is missing or the clip cannot be opened, `available` is False
+    and frame() always returns None so the caller can draw its placeholder.
+    """
+
+    def __init__(self, path, size, buffer_frames=3, loop=True):
+        self.size = size
+        self.loop = loop
+        self.clip = None
+        self.fps = 24
+        self.duration = None
+
+        # Benchmark counters
+        self.decoded = 0
+        self.dropped = 0
+        self.shown = 0
+
+        self._ring = deque()
+        self._max_buffer = buffer_frames
+        self._cond = threading.Condition()
+        self._current = None
+        self._running = False
+        self._start = None
+
+        if mp is None or not os.path.exists(path):
+            return
+        try:
+            self.clip = mp.VideoFileClip(path).resize(size)
+        except Exception as e:
+            print("⚠️ Could not open simulation video:", e)
+            return
+        self.fps = self.clip.fps or self.fps
+        self.duration = self.clip.duration
+
+        self._running = True
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._decode, name="video-decode", daemon=True)
+        self._thread.start()
+
+    @property
+    def available(self):
+        return self.clip is not None
+
+    def _wall_index(self):
+        return int((time.perf_counter() - self._start) * self.fps)
+
+    def frame(self):
+        """The newest decoded frame that is due on the wall clock (render thread)."""
+        if not self.available:
+            return None
+        due = self._wall_index()
+        with self._cond:
+            popped = 0
+            while self._ring and self._ring[0][0] <= due:
+                self._current = self._ring.popleft()
+                popped += 1
+            if popped:
+                self.shown += 1
+                self.dropped += popped - 1  # decoded in time but overtaken before display
+                self._cond.notify()
+        return self._current[1] if self._current else None
+
+    def close(self):
+        """Stops decoding; the decoder thread releases the clip on its way out."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def stats(self):
+        return {"decoded": self.decoded, "dropped": self.dropped, "shown": self.shown,
+                "buffered": len(self._ring)}
+
+    # ---------- decoder thread ----------
+    def _decode(self):
+        try:
+            self._decode_frames()
+        finally:
+            try:
+                self.clip.close()
+            except Exception:
+                pass
+
+    def _decode_frames(self):
+        index = 0
+        while True:
+            with self._cond:
+                while self._running and len(self._ring) >= self._max_buffer:
+                    self._cond.wait(0.1)
+                if not self._running:
+                    return
+
+            due = self._wall_index()
+            if index < due:
+                # Fell behind the wall clock: skip straight to the frame that is due now
+                with self._cond:
+                    self.dropped += due - index
+                index = due
+
+            t = index / self.fps
+            if self.duration:
+                if t >= self.duration and not self.loop:
+                    return
+                t %= self.duration
+            try:
+                array = np.ascontiguousarray(self.clip.get_frame(t), dtype=np.uint8)
+            except Exception as e:
+                print("⚠️ Video decode error:", e)
+                return
+            # frombuffer shares the array's memory; the ring keeps the array alive with it
+            surf = pygame.image.frombuffer(array, (array.shape[1], array.shape[0]), "RGB")
+            with self._cond:
+                self._ring.append((index, surf, array))
+            self.decoded += 1
+            index += 1